@@ -47,10 +47,12 @@ Detect splash events in a WAV file::
 from __future__ import annotations
 
 import argparse
+import logging
+import os
 import sys
 from pathlib import Path
 
-_SUPPORTED_EXTS = {".wav", ".mp3", ".flac"}
+_SUPPORTED_EXTS = frozenset({".wav", ".mp3", ".flac"})
 _IG_SUPPORTED_EXTS = {".wav", ".mp3", ".flac", ".m4a"}
 _IG_DEFAULT_GLOBS = ["**/*.wav", "**/*.mp3", "**/*.flac", "**/*.m4a"]
 
@@ -64,7 +66,14 @@ def _collect_inputs(src: Path) -> list[Path]:
             sys.exit(f"Unsupported file type: {src.suffix!r}")
         return [src]
     if src.is_dir():
-        files = sorted(p for p in src.iterdir() if p.suffix.lower() in _SUPPORTED_EXTS)
+        # One scandir pass; DirEntry.is_file() reuses the d_type from readdir
+        with os.scandir(src) as it:
+            files = sorted(
+                src / entry.name
+                for entry in it
+                if os.path.splitext(entry.name)[1].lower() in _SUPPORTED_EXTS
+                and entry.is_file()
+            )
         if not files:
             sys.exit(f"No audio files found in {src}")
         return files
@@ -116,7 +125,7 @@ def _cmd_run(args: argparse.Namespace) -> None:
     config_path = args.config
     if not config_path.exists():
         sys.exit(f"Config file not found: {config_path}")
-    run_pipeline(config_path)
+    run_pipeline(config_path, jobs=args.jobs)
 
 
 def _cmd_process(args: argparse.Namespace) -> None:
@@ -440,6 +449,13 @@ def _build_parser() -> argparse.ArgumentParser:
         metavar="FILE",
         help="Pipeline config file (default: pipeline.yaml)",
     )
+    p_run.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Process N input files in parallel (default: 1)",
+    )
 
     # ── analyze ───────────────────────────────────────────────────────────────
     p_an = sub.add_parser("analyze", help="Extract audio features to JSON")
@@ -706,6 +722,9 @@ def main() -> None:
     parser = _build_parser()
     args = parser.parse_args()
 
+    # Step progress goes through the "hydral" loggers; show it on the CLI.
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     if args.command == "run":
         _cmd_run(args)
     elif args.command == "analyze":
@@ -0,0 +1,65 @@
+"""Helpers shared by the hydral test modules (not collected by pytest)."""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+def pcm16_wav_bytes(audio: np.ndarray, sr: int) -> bytes:
+    """Return a 16-bit PCM mono WAV (44-byte header + samples), as sf.write would.
+
+    PCM_16 rather than float so that GrainStep's pydub loader can read it
+    without ffprobe.
+    """
+    pcm = np.rint(np.clip(audio, -1.0, 1.0) * 32767).astype("<i2")
+    data_size = pcm.nbytes
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sr, sr * 2, 2, 16,
+        b"data", data_size,
+    )
+    return header + pcm.tobytes()
+
+
+@functools.lru_cache(maxsize=None)
+def tone_wav_bytes(duration_sec: float, sr: int) -> bytes:
+    """Encode the test sine tone once per (duration, sr) and return the WAV bytes."""
+    # Phase ramp → sin → gain, all in place in one float32 buffer
+    audio = np.arange(int(sr * duration_sec), dtype=np.float32)
+    np.multiply(audio, np.float32(2 * np.pi * 440 / sr), out=audio)
+    np.sin(audio, out=audio)
+    np.multiply(audio, np.float32(0.3), out=audio)
+    return pcm16_wav_bytes(audio, sr)
+
+
+def make_wav(path: Path, duration_sec: float = 1.0, sr: int = 22050) -> None:
+    """Write a simple sine-wave WAV for testing."""
+    path.write_bytes(tone_wav_bytes(duration_sec, sr))
+
+
+def make_header_only_wav(path: Path, sr: int = 22050) -> None:
+    """Write a valid zero-frame WAV, for tests that only need header metadata."""
+    path.write_bytes(pcm16_wav_bytes(np.zeros(0, dtype=np.float32), sr))
+
+
+def touch_many(*paths: Path) -> None:
+    """Create empty files (open(O_CREAT) + close, no utime like Path.touch)."""
+    for p in paths:
+        os.close(os.open(p, os.O_CREAT | os.O_WRONLY, 0o644))
+
+
+def read_json(path: Path):
+    """Parse the JSON file at *path* in one read (orjson when available)."""
+    return _loads(path.read_bytes())
@@ -0,0 +1,91 @@
+from functools import lru_cache
+
+import librosa
+import numpy as np
+import scipy.fft
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import get_window
+
+# librosa の既定値（n_fft=2048, 周期 Hann 窓, center=True）に揃える
+N_FFT = 2048
+_HANN_WINDOW = get_window("hann", N_FFT, fftbins=True).astype(np.float32)
+
+# bands.py と同じ帯域定義（Hz）
+BAND_RANGES_HZ = {
+    "low": (20.0, 200.0),
+    "mid": (200.0, 2000.0),
+    "high": (2000.0, 8000.0),
+}
+
+# onset_strength と同じ dB 変換パラメータ
+_AMIN = 1e-10
+_TOP_DB = 80.0
+
+
+@lru_cache(maxsize=8)
+def _mel_basis(sample_rate: int) -> np.ndarray:
+    """サンプリングレートごとのメルフィルタバンク（n_mels × bins）"""
+    return librosa.filters.mel(sr=sample_rate, n_fft=N_FFT)
+
+
+def extract_all_features(
+    waveform: np.ndarray,
+    sample_rate: int,
+    hop_length: int = 512
+) -> dict[str, np.ndarray]:
+    """
+    1 回のフレーム化と STFT から RMS・帯域エネルギー・オンセット強度を抽出する
+
+    extract_rms_energy / extract_frequency_band_energies /
+    extract_onset_strength をそれぞれ呼ぶと波形のフレーム化と FFT が
+    3 回行われるため、共通部分を一度だけ計算して各特徴量へ縮約する。
+
+    Parameters
+    ----------
+    waveform : np.ndarray
+        モノラル音声の時間波形
+    sample_rate : int
+        サンプリングレート（Hz）
+    hop_length : int
+        フレーム間隔（サンプル数）
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        rms / low / mid / high / onset 各特徴量の時系列
+    """
+
+    # center=True 相当のゼロパディング後にフレーム化（コピーなしのビュー）
+    padded = np.pad(waveform.astype(np.float32, copy=False), N_FFT // 2, mode="constant")
+    frames = sliding_window_view(padded, N_FFT)[::hop_length]
+
+    # RMS: 窓なしフレームの二乗平均平方根
+    rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / N_FFT)
+
+    # パワースペクトル（フレーム × 周波数ビン）
+    stft_complex = scipy.fft.rfft(frames * _HANN_WINDOW, axis=1, workers=-1)
+    power = np.square(stft_complex.real)
+    power += np.square(stft_complex.imag)
+    magnitude = np.sqrt(power)
+
+    # 帯域エネルギー: 帯域内ビンの平均振幅
+    frequency_bins_hz = scipy.fft.rfftfreq(N_FFT, d=1.0 / sample_rate)
+    features: dict[str, np.ndarray] = {"rms": rms}
+    for band_name, (low_hz, high_hz) in BAND_RANGES_HZ.items():
+        start, stop = np.searchsorted(frequency_bins_hz, [low_hz, high_hz], side="left")
+        features[band_name] = magnitude[:, start:stop].mean(axis=1)
+
+    # オンセット強度: メル dB スペクトルの正の差分を帯域平均
+    mel_db = 10.0 * np.log10(np.maximum(_AMIN, power @ _mel_basis(sample_rate).T))
+    mel_db = np.maximum(mel_db, mel_db.max() - _TOP_DB)
+    flux = np.maximum(0.0, mel_db[1:] - mel_db[:-1]).mean(axis=1)
+
+    # librosa と同様に lag + n_fft // (2 * hop) フレーム分だけ先頭を埋めて揃える
+    num_frames = frames.shape[0]
+    onset = np.zeros(num_frames, dtype=flux.dtype)
+    offset = 1 + N_FFT // (2 * hop_length)
+    if offset < num_frames:
+        onset[offset:] = flux[: num_frames - offset]
+    features["onset"] = onset
+
+    return features
@@ -0,0 +1,18 @@
+"""pytest configuration shared by the hydral test modules.
+
+Puts ``src/`` on ``sys.path`` once per session and imports the light-weight
+hydral modules the tests use, so per-test ``from hydral.X import ...``
+statements are served straight from ``sys.modules``.
+"""
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import hydral.__main__  # noqa: E402,F401
+import hydral.artifacts  # noqa: E402,F401
+import hydral.pipeline  # noqa: E402,F401
+import hydral.steps  # noqa: E402,F401
+import hydral.yaml_runner  # noqa: E402,F401
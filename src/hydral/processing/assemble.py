@@ -8,10 +8,16 @@ from pydub import AudioSegment
 def concat(grains: Sequence[AudioSegment]) -> AudioSegment:
     """
     単純連結（クロスフェード無し）。
+    フォーマットが揃っていれば生データを一度に join し、
+    out += g の繰り返しによる二乗オーダーのコピーを避ける。
     """
     if not grains:
         return AudioSegment.silent(duration=0)
-    out = grains[0]
+    first = grains[0]
+    fmt = (first.sample_width, first.frame_rate, first.channels)
+    if all((g.sample_width, g.frame_rate, g.channels) == fmt for g in grains):
+        return first._spawn(b"".join(g.raw_data for g in grains))
+    out = first
     for g in grains[1:]:
         out += g
     return out
@@ -67,14 +67,9 @@ def bandpass_filter(
     # Design Butterworth bandpass filter
     sos = butter(order, [low_hz, high_hz], btype='band', fs=sr, output='sos')
     
-    # Apply filter (handles multi-channel)
-    if audio.ndim == 1:
-        filtered = sosfiltfilt(sos, audio)
-    else:
-        # Apply to each channel separately
-        filtered = np.array([sosfiltfilt(sos, audio[ch]) for ch in range(audio.shape[0])])
-    
-    return filtered
+    # Apply filter along the sample axis; multi-channel input (channels, samples)
+    # is filtered in a single call instead of one call per channel
+    return sosfiltfilt(sos, audio, axis=-1)
 
 
 def separate_tonal_noise(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import json
 import os
@@ -11,17 +12,23 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def log_info(message: str) -> None:
-    print(f"[INFO] {message}")
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
 
-
-def log_warn(message: str) -> None:
-    print(f"[WARN] {message}", file=sys.stderr)
-
-
-def log_error(message: str) -> None:
-    print(f"[ERROR] {message}", file=sys.stderr)
+from processing.log_buffer import (
+    flush_info,
+    log_error,
+    log_info,
+    log_info_buffered,
+    log_warn,
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -122,6 +129,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Place all files directly in dst without type subdirectories",
     )
+    parser.add_argument(
+        "--no-preserve-meta",
+        dest="preserve_meta",
+        action="store_false",
+        help="Copy file contents only, without timestamps and permission bits",
+    )
     parser.add_argument(
         "--strict",
         action="store_true",
@@ -150,6 +163,10 @@ EXT_TO_TYPE = {
     "yml": "meta",
 }
 
+# Same mapping keyed by the raw dotted suffix, so the common lowercase case
+# resolves with a single dict lookup on Path.suffix
+SUFFIX_TO_TYPE = {f".{ext}": file_type for ext, file_type in EXT_TO_TYPE.items()}
+
 
 def normalize_ext(ext: str) -> str:
     """Normalize extension by removing leading dot and converting to lowercase."""
@@ -158,8 +175,11 @@ def normalize_ext(ext: str) -> str:
 
 def get_file_type(path: Path) -> str:
     """Determine file type category from extension."""
-    ext = normalize_ext(path.suffix)
-    return EXT_TO_TYPE.get(ext, "other")
+    suffix = path.suffix
+    file_type = SUFFIX_TO_TYPE.get(suffix)
+    if file_type is None:
+        file_type = EXT_TO_TYPE.get(normalize_ext(suffix), "other")
+    return file_type
 
 
 def parse_ext_list(ext_str: str) -> Set[str]:
@@ -202,14 +222,6 @@ def scan_files(
     return sorted(files)
 
 
-def group_files_by_stem(files: List[Path]) -> Dict[str, List[Path]]:
-    """Group files by their stem (basename without extension)."""
-    groups: Dict[str, List[Path]] = defaultdict(list)
-    for path in files:
-        groups[path.stem].append(path)
-    return dict(groups)
-
-
 def compute_sha256(path: Path) -> Optional[str]:
     """Compute SHA256 hash of a file."""
     try:
@@ -231,6 +243,15 @@ def get_file_size(path: Path) -> int:
         return 0
 
 
+def get_hash_key(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the (path, size, mtime_ns) identity a cached sha256 is tied to."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return {"path": str(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
 def load_json_metadata(path: Path) -> Optional[Dict[str, Any]]:
     """Load JSON metadata file."""
     try:
@@ -241,6 +262,7 @@ def load_json_metadata(path: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
+@functools.lru_cache(maxsize=32)
 def extract_pack_version(dst_path: Path) -> str:
     """Extract pack version from destination path (e.g., v1, v2)."""
     parts = dst_path.parts
@@ -257,35 +279,107 @@ def apply_rename(filename: str, prefix: str, suffix: str) -> str:
     return f"{prefix}{stem}{suffix}{ext}"
 
 
+def _copy_data_in_kernel(src_path: Path, dst_fd: int) -> bool:
+    """Copy file contents into *dst_fd* with os.copy_file_range.
+
+    Returns False when unavailable or rejected by the kernel/filesystem; the
+    caller then redoes the copy in user space.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+
+    src_fd = os.open(src_path, os.O_RDONLY)
+    try:
+        while copy_file_range(src_fd, dst_fd, 1 << 30) > 0:
+            pass
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(src_fd)
+
+
+def copy_file(src_path: Path, dst_path: Path, preserve_meta: bool = True) -> None:
+    """Copy a file with shutil.copy2 semantics, moving the data in-kernel.
+
+    The copy is written to ``<dst>.tmp`` and renamed over *dst_path*, so an
+    existing dst that is a hardlink or symlink to the source is replaced
+    rather than truncated through.  The temp file is created with mode 0o666
+    so the process umask applies.  Contents go through os.copy_file_range on
+    the same filesystem, otherwise shutil.copyfile; timestamps and permission
+    bits are then copied with shutil.copystat unless ``preserve_meta`` is
+    False (--no-preserve-meta).
+    """
+    tmp_path = dst_path.with_name(dst_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    # O_EXCL: never write through a pre-existing entry at the temp path
+    tmp_fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            copied = (
+                src_path.stat().st_dev == dst_path.parent.stat().st_dev
+                and _copy_data_in_kernel(src_path, tmp_fd)
+            )
+        finally:
+            os.close(tmp_fd)
+        if not copied:
+            shutil.copyfile(src_path, tmp_path)
+        if preserve_meta:
+            shutil.copystat(src_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _is_same_entry(src_path: Path, dst_path: Path) -> bool:
+    """Return True if both paths name the same directory entry."""
+    return (
+        src_path.parent.resolve() / src_path.name
+        == dst_path.parent.resolve() / dst_path.name
+    )
+
+
 def perform_export(
     src_path: Path,
     dst_path: Path,
     mode: str,
     strict: bool,
+    preserve_meta: bool = True,
 ) -> bool:
-    """Perform the actual file export operation."""
+    """Perform the actual file export operation.
+
+    An existing dst (only planned with --overwrite) is replaced: copy mode
+    renames a fresh copy over it, link modes unlink the old entry first.
+    Neither writes through a dst that links back to the source.
+    """
     try:
+        if _is_same_entry(src_path, dst_path):
+            raise shutil.SameFileError(f"{src_path} and {dst_path} are the same file")
         dst_path.parent.mkdir(parents=True, exist_ok=True)
         
         if mode == "copy":
-            shutil.copy2(src_path, dst_path)
+            copy_file(src_path, dst_path, preserve_meta)
         elif mode == "hardlink":
             try:
+                dst_path.unlink(missing_ok=True)
                 os.link(src_path, dst_path)
             except OSError as exc:
                 if strict:
                     raise
                 log_warn(f"Hardlink failed, falling back to copy: {exc}")
-                shutil.copy2(src_path, dst_path)
+                copy_file(src_path, dst_path, preserve_meta)
         elif mode == "symlink":
             try:
+                dst_path.unlink(missing_ok=True)
                 # Use absolute path for symlink source to avoid issues
                 dst_path.symlink_to(src_path.resolve())
             except OSError as exc:
                 if strict:
                     raise
                 log_warn(f"Symlink failed, falling back to copy: {exc}")
-                shutil.copy2(src_path, dst_path)
+                copy_file(src_path, dst_path, preserve_meta)
         return True
     except OSError as exc:
         log_error(f"Export failed for {src_path} -> {dst_path}: {exc}")
@@ -340,8 +434,26 @@ def build_manifest_items(
     dst_dir: Path,
     group_by_stem: bool,
     use_dst_paths: bool = True,
+    cached_items: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> List[Dict[str, Any]]:
-    """Build manifest items from export operations."""
+    """Build manifest items from export operations.
+
+    If ``cached_items`` (existing manifest items keyed by id) is given, the
+    audio hash of an item is reused when the hashed source file still has the
+    same path, size and mtime (see get_hash_key).
+    """
+    cached_items = cached_items or {}
+    
+    # dst paths are built as dst_dir / ..., so slicing off the prefix is enough
+    dst_prefix = str(dst_dir) + os.sep
+    prefix_len = len(dst_prefix)
+    
+    def rel_str(dst_path: Path) -> str:
+        path_str = str(dst_path)
+        if path_str.startswith(dst_prefix):
+            return path_str[prefix_len:]
+        return str(dst_path.relative_to(dst_dir))
+    
     if group_by_stem:
         # Group by stem - keep track of both src and dst paths
         stem_groups: Dict[str, Dict[str, List[Tuple[Path, Path]]]] = defaultdict(
@@ -364,13 +476,14 @@ def build_manifest_items(
                         tags = metadata.get("tags", [])
                         break
             
-            # Calculate hash for audio files - use source if dst doesn't exist yet
-            audio_hash = None
+            # Hash only the first audio file; its source is what the export
+            # copied/linked, so hashing and stat-ing it avoids dst mtime churn
+            hash_path = None
             total_size = 0
             for src_path, dst_path in type_files.get("audio", []):
                 check_path = dst_path if use_dst_paths and dst_path.exists() else src_path
-                if audio_hash is None:  # Only hash first audio file
-                    audio_hash = compute_sha256(check_path)
+                if hash_path is None:
+                    hash_path = src_path
                 total_size += get_file_size(check_path)
             
             # Add sizes for other files
@@ -379,11 +492,26 @@ def build_manifest_items(
                     check_path = dst_path if use_dst_paths and dst_path.exists() else src_path
                     total_size += get_file_size(check_path)
             
+            # Reuse the cached hash when the hashed file is unchanged
+            audio_hash = None
+            hash_key = None
+            if hash_path is not None:
+                hash_key = get_hash_key(hash_path)
+                cached = cached_items.get(stem)
+                if (
+                    cached is not None
+                    and cached.get("sha256")
+                    and hash_key is not None
+                    and cached.get("sha256_key") == hash_key
+                ):
+                    audio_hash = cached["sha256"]
+                else:
+                    audio_hash = compute_sha256(hash_path)
+            
             # Build relative paths
             files_dict = {}
             for file_type, path_pairs in type_files.items():
-                rel_paths = [str(dst_path.relative_to(dst_dir)) for _, dst_path in path_pairs]
-                files_dict[file_type] = sorted(rel_paths)
+                files_dict[file_type] = sorted(rel_str(dst_path) for _, dst_path in path_pairs)
             
             item = {
                 "id": stem,
@@ -391,6 +519,8 @@ def build_manifest_items(
             }
             if audio_hash:
                 item["sha256"] = audio_hash
+                if hash_key is not None:
+                    item["sha256_key"] = hash_key
             if total_size > 0:
                 item["size_bytes"] = total_size
             if tags:
@@ -401,10 +531,9 @@ def build_manifest_items(
         # Simple file list
         items = []
         for src_path, dst_path, file_type in operations:
-            rel_path = str(dst_path.relative_to(dst_dir))
             item = {
                 "id": dst_path.stem,
-                "file": rel_path,
+                "file": rel_str(dst_path),
                 "type": file_type,
                 "size_bytes": get_file_size(src_path),
             }
@@ -431,19 +560,51 @@ def load_existing_manifest(manifest_path: Path) -> Dict[str, Any]:
     }
 
 
+def dump_manifest_bytes(manifest: Dict[str, Any]) -> bytes:
+    """Serialize manifest to UTF-8 JSON bytes (orjson if available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    return json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a temp file with raw os.write calls, then rename over path."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    except OSError:
+        os.close(fd)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
+
 def update_manifest(
     manifest_path: Path,
     src_dir: Path,
     dst_dir: Path,
     mode: str,
     new_items: List[Dict[str, Any]],
+    manifest: Optional[Dict[str, Any]] = None,
+    generated_at: Optional[str] = None,
 ) -> None:
-    """Update or create manifest.json."""
-    manifest = load_existing_manifest(manifest_path)
+    """Update or create manifest.json.
+
+    ``manifest`` may be passed when the caller already loaded it, and
+    ``generated_at`` when the run timestamp was taken up front.
+    """
+    if manifest is None:
+        manifest = load_existing_manifest(manifest_path)
     
     # Update metadata
     manifest["pack_version"] = extract_pack_version(dst_dir)
-    manifest["generated_at"] = datetime.now(timezone.utc).isoformat()
+    manifest["generated_at"] = generated_at or datetime.now(timezone.utc).isoformat()
     manifest["source_dir"] = str(src_dir)
     manifest["export_mode"] = mode
     
@@ -456,15 +617,22 @@ def update_manifest(
     
     # Write manifest
     try:
-        with manifest_path.open("w", encoding="utf-8") as f:
-            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        write_bytes_atomic(manifest_path, dump_manifest_bytes(manifest))
         log_info(f"Manifest updated: {manifest_path}")
     except OSError as exc:
         log_error(f"Failed to write manifest: {exc}")
 
 
 def main() -> None:
+    try:
+        _main()
+    finally:
+        flush_info()
+
+
+def _main() -> None:
     args = parse_args()
+    generated_at = datetime.now(timezone.utc).isoformat()
     
     # Parse extension filters
     include_exts = parse_ext_list(args.include_ext)
@@ -518,19 +686,36 @@ def main() -> None:
     failed_count = 0
     
     for src_path, dst_path, file_type in operations:
-        if perform_export(src_path, dst_path, args.mode, args.strict):
+        if perform_export(
+            src_path, dst_path, args.mode, args.strict, args.preserve_meta
+        ):
             success_count += 1
-            log_info(f"Exported: {src_path.name} -> {dst_path.relative_to(args.dst)}")
+            log_info_buffered(f"Exported: {src_path.name} -> {dst_path.relative_to(args.dst)}")
         else:
             failed_count += 1
     
     # Update manifest
     if args.pack_manifest and success_count > 0:
         manifest_path = args.dst / args.manifest_name
+        manifest = load_existing_manifest(manifest_path)
+        cached_items = {item["id"]: item for item in manifest.get("items", [])}
         manifest_items = build_manifest_items(
-            operations, args.src, args.dst, args.group_by_stem, use_dst_paths=True
+            operations,
+            args.src,
+            args.dst,
+            args.group_by_stem,
+            use_dst_paths=True,
+            cached_items=cached_items,
+        )
+        update_manifest(
+            manifest_path,
+            args.src,
+            args.dst,
+            args.mode,
+            manifest_items,
+            manifest=manifest,
+            generated_at=generated_at,
         )
-        update_manifest(manifest_path, args.src, args.dst, args.mode, manifest_items)
     
     # Summary
     log_info("=" * 60)
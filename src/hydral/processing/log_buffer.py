@@ -0,0 +1,44 @@
+"""Console logging helpers shared by the processing CLI scripts.
+
+Per-file INFO lines are queued with :func:`log_info_buffered` and written in
+batches of :data:`INFO_FLUSH_INTERVAL`.  The other helpers flush the queue
+first, so lines keep their order.  Scripts call :func:`flush_info` in a
+``finally`` around their main loop so queued lines survive an early exit.
+"""
+from __future__ import annotations
+
+import sys
+from typing import List
+
+# Per-file INFO lines are queued and written in batches of this size
+INFO_FLUSH_INTERVAL = 128
+_info_buffer: List[str] = []
+
+
+def flush_info() -> None:
+    """Write out queued INFO lines in a single call."""
+    if _info_buffer:
+        sys.stdout.write("\n".join(_info_buffer) + "\n")
+        _info_buffer.clear()
+
+
+def log_info_buffered(message: str) -> None:
+    """Queue an INFO line for per-file loops; see flush_info."""
+    _info_buffer.append(f"[INFO] {message}")
+    if len(_info_buffer) >= INFO_FLUSH_INTERVAL:
+        flush_info()
+
+
+def log_info(message: str) -> None:
+    flush_info()
+    print(f"[INFO] {message}")
+
+
+def log_warn(message: str) -> None:
+    flush_info()
+    print(f"[WARN] {message}", file=sys.stderr)
+
+
+def log_error(message: str) -> None:
+    flush_info()
+    print(f"[ERROR] {message}", file=sys.stderr)
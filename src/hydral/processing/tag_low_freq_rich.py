@@ -8,25 +8,24 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import librosa
 import numpy as np
+import scipy.fft
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import get_window
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from analysis.audio_features.io import load_audio_waveform
+from processing.log_buffer import flush_info, log_info, log_info_buffered, log_warn
 
 MIN_FREQ_HZ = 20.0
 LOW_FREQ_MAX_HZ = 200.0
+N_FFT = 2048
 
-
-def log_info(message: str) -> None:
-    print(f"[INFO] {message}")
-
-
-def log_warn(message: str) -> None:
-    print(f"[WARN] {message}", file=sys.stderr)
+# librosa.stft と同じ周期 Hann 窓をモジュール読み込み時に一度だけ作る
+_HANN_WINDOW = get_window("hann", N_FFT, fftbins=True).astype(np.float32)
 
 
 def parse_args() -> argparse.Namespace:
@@ -71,6 +70,13 @@ def load_json(json_path: Path) -> Optional[Dict[str, Any]]:
     return data
 
 
+def _stft(waveform: np.ndarray, *, hop_length: int) -> np.ndarray:
+    """librosa.stft(center=True) 相当の片側スペクトルを (frames, bins) で返す。"""
+    padded = np.pad(waveform, N_FFT // 2, mode="constant")
+    frames = sliding_window_view(padded, N_FFT)[::hop_length]
+    return scipy.fft.rfft(frames * _HANN_WINDOW, axis=1, workers=-1)
+
+
 def compute_low_band_ratio(
     wav_path: Path,
     *,
@@ -81,28 +87,30 @@ def compute_low_band_ratio(
         if waveform.size == 0:
             return None, "empty_waveform", None
 
-        stft_complex = librosa.stft(waveform, hop_length=hop_length)
+        stft_complex = _stft(waveform, hop_length=hop_length)
         if stft_complex.size == 0:
             return None, "empty_stft", None
 
-        power_spectrogram = np.abs(stft_complex) ** 2
-        frequency_bins_hz = librosa.fft_frequencies(sr=sample_rate)
+        # |X|^2 を float32 で直接計算し、np.abs の一時配列を作らない
+        power_spectrogram = np.square(stft_complex.real, dtype=np.float32)
+        power_spectrogram += np.square(stft_complex.imag, dtype=np.float32)
+        # 時間方向に一度だけ畳み込み、以降は連続したビン範囲のスライスで集計する
+        bin_energy = power_spectrogram.sum(axis=0, dtype=np.float32)
+        frequency_bins_hz = scipy.fft.rfftfreq(N_FFT, d=1.0 / sample_rate)
 
-        valid_mask = frequency_bins_hz >= MIN_FREQ_HZ
-        if not np.any(valid_mask):
+        valid_start = int(np.searchsorted(frequency_bins_hz, MIN_FREQ_HZ, side="left"))
+        if valid_start >= frequency_bins_hz.size:
             return None, "invalid_frequency_range", None
 
-        total_energy = float(power_spectrogram[valid_mask].sum())
+        total_energy = float(bin_energy[valid_start:].sum(dtype=np.float64))
         if total_energy <= 0.0 or not math.isfinite(total_energy):
             return None, "silent_audio", None
 
-        low_mask = (frequency_bins_hz >= MIN_FREQ_HZ) & (
-            frequency_bins_hz < LOW_FREQ_MAX_HZ
-        )
-        if not np.any(low_mask):
+        low_end = int(np.searchsorted(frequency_bins_hz, LOW_FREQ_MAX_HZ, side="left"))
+        if low_end <= valid_start:
             return None, "low_band_missing", None
 
-        low_energy = float(power_spectrogram[low_mask].sum())
+        low_energy = float(bin_energy[valid_start:low_end].sum(dtype=np.float64))
         ratio = low_energy / total_energy
         if not math.isfinite(ratio):
             return None, "ratio_invalid", None
@@ -129,6 +137,13 @@ def write_json(
 
 
 def main() -> None:
+    try:
+        _main()
+    finally:
+        flush_info()
+
+
+def _main() -> None:
     args = parse_args()
     data_root = args.data_root
     ext = normalize_ext(args.ext)
@@ -147,7 +162,7 @@ def main() -> None:
     skip_reasons: Dict[str, int] = {}
 
     for index, wav_path in enumerate(wav_paths, start=1):
-        log_info(f"[{index}/{total_wav}] {wav_path}")
+        log_info_buffered(f"[{index}/{total_wav}] {wav_path}")
         json_path = wav_path.with_suffix(".json")
         if not json_path.exists():
             log_warn(f"JSON not found, skipped: {json_path}")
@@ -213,7 +228,7 @@ def main() -> None:
 
         updated_count += 1
         if args.dry_run:
-            log_info(
+            log_info_buffered(
                 f"[DRY RUN] {json_path}: low_band_ratio={ratio:.4f}, "
                 f"rich={is_rich}, tags={tags}"
             )
@@ -221,7 +236,7 @@ def main() -> None:
 
         try:
             write_json(json_path, data=data, backup=args.backup)
-            log_info(f"Updated: {json_path} (low_band_ratio={ratio:.4f})")
+            log_info_buffered(f"Updated: {json_path} (low_band_ratio={ratio:.4f})")
         except OSError as exc:
             log_warn(f"Failed to write JSON: {json_path} ({exc})")
             skip_reasons["write_failed"] = skip_reasons.get("write_failed", 0) + 1
@@ -26,12 +26,18 @@ CLI usage::
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import soundfile as sf
 
+logger = logging.getLogger(__name__)
+
 SCHEMA_VERSION = "v1"
 
 # Keys that identify a fully-formed v1 document.
@@ -47,6 +53,23 @@ _LEGACY_FIELD_MAP: Dict[str, str] = {
     "rms_db": "mean_rms",
     "rms_mean": "mean_rms",
 }
+_LEGACY_KEYS = frozenset(_LEGACY_FIELD_MAP)
+
+
+# Identity fields always taken from the canonical values, never from input.
+_IDENTITY_FIELDS = frozenset({"schema_version", "filename"})
+
+# Defaults for the non-audio v1 fields; copied per document.
+_V1_SKELETON: Dict[str, Any] = {
+    "schema_version": SCHEMA_VERSION,
+    "filename": None,
+    "duration_sec": None,
+    "sample_rate": None,
+    "channels": None,
+    "tags": None,
+    "normalized": False,
+    "mean_rms": None,
+}
 
 
 # ── Schema helpers ─────────────────────────────────────────────────────────
@@ -63,14 +86,26 @@ def is_v1(data: Dict[str, Any]) -> bool:
 
 def _read_wav_info(wav_path: Path) -> Dict[str, Any]:
     """Return basic audio info from *wav_path* using soundfile."""
-    info = sf.info(str(wav_path))
+    stat = os.stat(wav_path)
+    duration, samplerate, channels = _wav_header(
+        str(wav_path), stat.st_size, stat.st_mtime_ns
+    )
     return {
-        "duration_sec": info.duration,
-        "sample_rate": info.samplerate,
-        "channels": info.channels,
+        "duration_sec": duration,
+        "sample_rate": samplerate,
+        "channels": channels,
     }
 
 
+# Bounded cache keyed by (path, size, mtime_ns), so repeated migrations of
+# unchanged files only cost a ``stat`` without growing without limit in a
+# long-running process.
+@functools.lru_cache(maxsize=4096)
+def _wav_header(path: str, size: int, mtime_ns: int) -> Tuple[float, int, int]:
+    info = sf.info(path)
+    return info.duration, info.samplerate, info.channels
+
+
 def to_v1(wav_path: Path, existing: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Build a v1 metadata dict for *wav_path*.
 
@@ -92,32 +127,26 @@ def to_v1(wav_path: Path, existing: Optional[Dict[str, Any]] = None) -> Dict[str
     dict
         A fully-formed v1 metadata document.
     """
-    wav_info = _read_wav_info(wav_path)
-
-    # Start from the v1 skeleton
-    doc: Dict[str, Any] = {
-        "schema_version": SCHEMA_VERSION,
-        "filename": wav_path.name,
-        "duration_sec": wav_info["duration_sec"],
-        "sample_rate": wav_info["sample_rate"],
-        "channels": wav_info["channels"],
-        "tags": [],
-        "normalized": False,
-        "mean_rms": None,
-    }
+    # Start from the v1 skeleton (key order matters for the written JSON)
+    doc = _V1_SKELETON.copy()
+    doc.update(_read_wav_info(wav_path))
+    doc["filename"] = wav_path.name
+    doc["tags"] = []
 
     if existing:
-        # Translate legacy field names first
-        translated: Dict[str, Any] = {}
-        for k, v in existing.items():
-            canonical = _LEGACY_FIELD_MAP.get(k, k)
-            translated[canonical] = v
-
-        # Merge: existing values override defaults (except identity fields)
-        for k, v in translated.items():
-            if k in ("schema_version", "filename"):
-                continue  # always use canonical values
-            doc[k] = v
+        # Existing values override defaults (except identity fields).
+        # Already-migrated sidecars carry no legacy keys, so the name
+        # translation is skipped entirely in that (common) case.
+        if _LEGACY_KEYS.isdisjoint(existing):
+            for k, v in existing.items():
+                if k not in _IDENTITY_FIELDS:
+                    doc[k] = v
+        else:
+            canonical_name = _LEGACY_FIELD_MAP.get  # bound once for the loop
+            for k, v in existing.items():
+                canonical = canonical_name(k, k)
+                if canonical not in _IDENTITY_FIELDS:
+                    doc[canonical] = v
 
     return doc
 
@@ -130,6 +159,25 @@ def _sidecar_path(wav_path: Path) -> Path:
     return wav_path.with_suffix(".json")
 
 
+def _classify_sidecar(raw: bytes) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Return ``(already_v1, existing)`` for the raw bytes of a sidecar JSON.
+
+    The sidecar is always fully parsed so that truncated or corrupt files
+    are regenerated.  Corrupt JSON is reported as ``(False, None)``
+    (treated as absent).
+    """
+    try:
+        existing = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return False, None
+    return is_v1(existing), existing
+
+
+def _encode_doc(doc: Dict[str, Any]) -> bytes:
+    """Serialize a v1 document for writing as a sidecar."""
+    return json.dumps(doc, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def ensure_metadata(wav_path: Path) -> Tuple[Path, bool]:
     """Ensure a v1 sidecar JSON exists alongside *wav_path*.
 
@@ -151,17 +199,16 @@ def ensure_metadata(wav_path: Path) -> Tuple[Path, bool]:
     existing: Optional[Dict[str, Any]] = None
     if json_path.exists():
         try:
-            with open(json_path, encoding="utf-8") as fh:
-                existing = json.load(fh)
-        except (json.JSONDecodeError, OSError):
-            existing = None  # treat corrupt JSON as absent
-
-    if existing is not None and is_v1(existing):
-        return json_path, False
+            raw = json_path.read_bytes()
+        except OSError:
+            raw = None  # treat unreadable sidecar as absent
+        if raw is not None:
+            already_v1, existing = _classify_sidecar(raw)
+            if already_v1:
+                return json_path, False
 
     doc = to_v1(wav_path, existing)
-    with open(json_path, "w", encoding="utf-8") as fh:
-        json.dump(doc, fh, indent=2, ensure_ascii=False)
+    json_path.write_bytes(_encode_doc(doc))
 
     return json_path, True
 
@@ -169,34 +216,90 @@ def ensure_metadata(wav_path: Path) -> Tuple[Path, bool]:
 # ── Batch migration ────────────────────────────────────────────────────────
 
 
-def migrate_root(root: Path) -> Dict[str, int]:
+def _iter_wavs(root: str) -> Iterator[str]:
+    """Yield paths of ``*.wav`` files under *root* as plain strings.
+
+    Uses ``os.scandir`` directly: the dirent type avoids a ``stat`` per entry
+    and no ``Path`` objects are built while walking.  Symlinked directories
+    are not followed (same as ``Path.rglob``).
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".wav") and entry.is_file():
+                    yield entry.path
+
+
+def _migrate_one(wav_path: Path) -> Tuple[bool, bool]:
+    """Run :func:`ensure_metadata` and report ``(sidecar_existed, changed)``."""
+    existed_before = _sidecar_path(wav_path).exists()
+    _, changed = ensure_metadata(wav_path)
+    return existed_before, changed
+
+
+def _tally(wav_paths: List[Path], results: Iterable[Tuple[bool, bool]]) -> Dict[str, int]:
+    """Count and log :func:`_migrate_one` results, in *wav_paths* order."""
+    counts = {"created": 0, "updated": 0, "skipped": 0}
+    for wav_path, (existed_before, changed) in zip(wav_paths, results):
+        if changed:
+            if existed_before:
+                counts["updated"] += 1
+                logger.info("  updated  %s", wav_path)
+            else:
+                counts["created"] += 1
+                logger.info("  created  %s", wav_path)
+        else:
+            counts["skipped"] += 1
+    return counts
+
+
+def migrate_root(root: Path, jobs: Optional[int] = None) -> Dict[str, int]:
     """Walk *root* recursively and ensure every WAV has a v1 sidecar JSON.
 
+    Files are processed on a thread pool (``sf.info`` and file I/O release
+    the GIL); results are reported in sorted path order.
+
     Parameters
     ----------
     root:
         Directory to scan.
+    jobs:
+        Number of worker threads.  Defaults to twice the CPU count.
 
     Returns
     -------
     dict
         ``{"created": N, "updated": N, "skipped": N}`` counts.
     """
-    counts = {"created": 0, "updated": 0, "skipped": 0}
-    for wav_path in sorted(root.rglob("*.wav")):
-        sidecar = _sidecar_path(wav_path)
-        existed_before = sidecar.exists()
-        _, changed = ensure_metadata(wav_path)
-        if changed:
-            if existed_before:
-                counts["updated"] += 1
-                print(f"  updated  {wav_path}")
-            else:
-                counts["created"] += 1
-                print(f"  created  {wav_path}")
-        else:
-            counts["skipped"] += 1
-    return counts
+    wav_paths = [Path(p) for p in sorted(_iter_wavs(str(root)))]
+    if jobs is None:
+        jobs = (os.cpu_count() or 1) * 2
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        return _tally(wav_paths, executor.map(_migrate_one, wav_paths))
+
+
+def migrate_root_fast(root: Path) -> Dict[str, int]:
+    """Single-threaded :func:`migrate_root` without a thread pool.
+
+    Runs :func:`ensure_metadata` for each WAV on the calling thread, in the
+    same sorted path order as :func:`migrate_root`.  Cheaper than spinning up
+    a pool for small trees or already-migrated roots where most files are
+    skipped after one read.
+
+    Returns
+    -------
+    dict
+        ``{"created": N, "updated": N, "skipped": N}`` counts.
+    """
+    wav_paths = [Path(p) for p in sorted(_iter_wavs(str(root)))]
+    return _tally(wav_paths, map(_migrate_one, wav_paths))
 
 
 # ── CLI ────────────────────────────────────────────────────────────────────
@@ -214,6 +317,18 @@ def _build_parser() -> argparse.ArgumentParser:
         metavar="DIR",
         help="Root directory to scan for WAV files.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Number of worker threads (default: 2 x CPU count).",
+    )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Process files one by one on the main thread (no thread pool).",
+    )
     return parser
 
 
@@ -223,8 +338,13 @@ def main() -> None:
         import sys
         sys.exit(f"Root directory not found: {args.root}")
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print(f"🔍 Scanning {args.root} …")
-    counts = migrate_root(args.root)
+    if args.sequential:
+        counts = migrate_root_fast(args.root)
+    else:
+        counts = migrate_root(args.root, jobs=args.jobs)
     print(
         f"\n✅ Done — created: {counts['created']}, "
         f"updated: {counts['updated']}, "
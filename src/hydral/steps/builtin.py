@@ -16,36 +16,54 @@ at the bottom of this module.
 from __future__ import annotations
 
 import json
+import logging
 from pathlib import Path
 from typing import Any, Dict, List
 
-import numpy as np
-import soundfile as sf
-
-from hydral.analysis.audio_features.bands import extract_frequency_band_energies
-from hydral.analysis.audio_features.etract_energy import extract_rms_energy
-from hydral.analysis.audio_features.io import load_audio_waveform
-from hydral.analysis.audio_features.onset import extract_onset_strength
-from hydral.analysis.audio_features.smoothing import apply_moving_average
-from hydral.analysis.events.splash import (
-    compute_energy_envelope,
-    compute_onset_envelope,
-    detect_splash_events,
-    events_to_dicts,
-)
-from hydral.infra.audio import export_wav, load_wav
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# numpy / soundfile / librosa-backed helpers are imported inside each run()
+# so that importing this module (e.g. to build steps) stays cheap.
 from hydral.pipeline import PipelineContext
-from hydral.processing.assemble import concat
-from hydral.processing.band_split.split import split_into_bands
-from hydral.processing.grain import split_grains
-from hydral.processing.transform_mics import shuffle
 from hydral.steps.base import BaseStep
 from hydral.steps.registry import StepRegistry
 
+logger = logging.getLogger(__name__)
+
 
 # ── AnalyzeStep ────────────────────────────────────────────────────────────
 
 
+def _dump_features(features: Dict[str, Any]) -> bytes:
+    """Serialize *features* (top-level values may be 1-D ndarrays) to JSON bytes.
+
+    orjson encodes the arrays directly, writing float32 values with their
+    shortest float32 repr.  The stdlib fallback produces the same digits:
+    ``tolist()`` alone would widen float32 to float64 (``0.1`` →
+    ``0.10000000149011612``), so float32 arrays go through numpy's str()
+    first.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            features, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+        )
+    import numpy as np
+
+    def to_plain(value: Any) -> Any:
+        if not isinstance(value, np.ndarray):
+            return value
+        if value.dtype == np.float32:
+            return [float(s) for s in value.astype(str)]
+        return value.tolist()
+
+    plain = {k: to_plain(v) for k, v in features.items()}
+    return json.dumps(plain, indent=2).encode("utf-8")
+
+
 class AnalyzeStep(BaseStep):
     """Extract audio features and save them as ``<stem>_features.json``.
 
@@ -83,24 +101,32 @@ class AnalyzeStep(BaseStep):
         return (ctx.output_dir / f"{ctx.input_path.stem}_features.json").exists()
 
     def run(self, ctx: PipelineContext) -> PipelineContext:
+        import numpy as np
+
+        from hydral.analysis.audio_features.fused import extract_all_features
+        from hydral.analysis.audio_features.io import load_audio_waveform
+        from hydral.analysis.audio_features.smoothing import apply_moving_average
+
         effective_sr = ctx.sample_rate if ctx.sample_rate is not None else self.sr
         waveform, sr = load_audio_waveform(ctx.audio_path, target_sample_rate=effective_sr)
 
-        rms = extract_rms_energy(waveform, hop_length=self.hop_length)
-        bands = extract_frequency_band_energies(waveform, sr, hop_length=self.hop_length)
-        onset = extract_onset_strength(waveform, sr, hop_length=self.hop_length)
+        # One framing + STFT pass shared by RMS, band energies and onset
+        raw = extract_all_features(waveform, sr, hop_length=self.hop_length)
 
-        rms = apply_moving_average(rms, window_size=self.smoothing_window)
-        for k in bands:
-            bands[k] = apply_moving_average(bands[k], window_size=self.smoothing_window)
-        onset = apply_moving_average(onset, window_size=3)
+        rms = apply_moving_average(raw["rms"], window_size=self.smoothing_window)
+        bands = {
+            k: apply_moving_average(raw[k], window_size=self.smoothing_window)
+            for k in ("low", "mid", "high")
+        }
+        onset = apply_moving_average(raw["onset"], window_size=3)
 
+        # float32 is ample for these envelopes and serializes to ~half the digits
         features: dict = {
-            "rms": rms.tolist(),
-            "low": bands["low"].tolist(),
-            "mid": bands["mid"].tolist(),
-            "high": bands["high"].tolist(),
-            "onset": onset.tolist(),
+            "rms": rms.astype(np.float32, copy=False),
+            "low": bands["low"].astype(np.float32, copy=False),
+            "mid": bands["mid"].astype(np.float32, copy=False),
+            "high": bands["high"].astype(np.float32, copy=False),
+            "onset": onset.astype(np.float32, copy=False),
             "meta": {
                 "sample_rate": sr,
                 "hop_length": self.hop_length,
@@ -110,10 +136,10 @@ class AnalyzeStep(BaseStep):
 
         ctx.output_dir.mkdir(parents=True, exist_ok=True)
         out_path = ctx.output_dir / f"{ctx.input_path.stem}_features.json"
-        with open(out_path, "w", encoding="utf-8") as fh:
-            json.dump(features, fh, indent=2)
+        # Serialize in memory and write once instead of json.dump's many small writes
+        out_path.write_bytes(_dump_features(features))
 
-        print(f"  ✓ Features saved to {out_path}")
+        logger.info("  ✓ Features saved to %s", out_path)
         ctx.artifacts.features_json = out_path
         ctx.extra["features_path"] = out_path  # backward compat
         return ctx
@@ -152,6 +178,9 @@ class NormalizeStep(BaseStep):
     _BLOCK_FRAMES: int = 65536
 
     def run(self, ctx: PipelineContext) -> PipelineContext:
+        import numpy as np
+        import soundfile as sf
+
         ctx.output_dir.mkdir(parents=True, exist_ok=True)
         out_path = ctx.output_dir / f"{ctx.input_path.stem}_normalized.wav"
 
@@ -161,10 +190,15 @@ class NormalizeStep(BaseStep):
             sr = src.samplerate
             channels = src.channels
 
+            # One reusable block buffer for both passes: with ``out=`` soundfile
+            # reads into it directly instead of allocating a copy per block.
+            buf = np.empty((self._BLOCK_FRAMES, channels), dtype=np.float32)
+
             # 1st pass: find peak across all blocks
             peak = 0.0
-            for block in src.blocks(blocksize=self._BLOCK_FRAMES, dtype="float32"):
-                block_peak = float(np.max(np.abs(block)))
+            for block in src.blocks(out=buf):
+                # max/min reductions avoid materialising np.abs(block)
+                block_peak = max(float(block.max()), -float(block.min()))
                 if block_peak > peak:
                     peak = block_peak
 
@@ -180,10 +214,11 @@ class NormalizeStep(BaseStep):
                 subtype="FLOAT",
                 format="WAV",
             ) as dst:
-                for block in src.blocks(blocksize=self._BLOCK_FRAMES, dtype="float32"):
-                    dst.write(block * scale)
+                for block in src.blocks(out=buf):
+                    np.multiply(block, scale, out=block)
+                    dst.write(block)
 
-        print(f"  ✓ Normalized audio saved to {out_path}")
+        logger.info("  ✓ Normalized audio saved to %s", out_path)
         ctx.artifacts.normalized_wav = out_path
         ctx.extra["normalized_path"] = out_path  # backward compat
         ctx.audio_path = out_path  # pipe: next step reads normalised audio
@@ -218,22 +253,36 @@ class BandSplitStep(BaseStep):
         fp["params"] = {"filter_order": self.filter_order}
         return fp
 
+    # Fingerprint of the run that produced the band files, stored in band_dir
+    _FINGERPRINT_NAME: str = ".fingerprint.json"
+
     def output_exists(self, ctx: PipelineContext) -> bool:
-        band_dir = ctx.output_dir / f"{ctx.input_path.stem}_bands"
-        return band_dir.is_dir() and any(band_dir.iterdir())
+        """True only if the band files were produced from the same input and params."""
+        fp_path = ctx.output_dir / f"{ctx.input_path.stem}_bands" / self._FINGERPRINT_NAME
+        try:
+            stored = json.loads(fp_path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            return False
+        return stored == self.fingerprint(ctx)
 
     def run(self, ctx: PipelineContext) -> PipelineContext:
+        from hydral.processing.band_split.split import split_into_bands
+
         band_dir = ctx.output_dir / f"{ctx.input_path.stem}_bands"
+        fingerprint = self.fingerprint(ctx)  # before ctx.audio_path changes
         manifest = split_into_bands(
             input_path=ctx.audio_path,
             output_dir=band_dir,
             filter_order=self.filter_order,
         )
 
-        # Write manifest JSON alongside the band files
+        # split_into_bands already wrote the manifest JSON alongside the band files
         manifest_path = band_dir / "split_manifest.json"
+        (band_dir / self._FINGERPRINT_NAME).write_bytes(
+            json.dumps(fingerprint).encode("utf-8")
+        )
 
-        print(f"  ✓ Band split saved to {band_dir} ({len(manifest['outputs'])} files)")
+        logger.info("  ✓ Band split saved to %s (%d files)", band_dir, len(manifest["outputs"]))
         ctx.artifacts.band_dir = band_dir
         ctx.artifacts.band_manifest_json = manifest_path
         ctx.extra["band_split_manifest"] = manifest  # backward compat
@@ -271,6 +320,11 @@ class GrainStep(BaseStep):
         return (ctx.output_dir / f"{ctx.input_path.stem}_grain.wav").exists()
 
     def run(self, ctx: PipelineContext) -> PipelineContext:
+        from hydral.infra.audio import export_wav, load_wav
+        from hydral.processing.assemble import concat
+        from hydral.processing.grain import split_grains
+        from hydral.processing.transform_mics import shuffle
+
         audio = load_wav(ctx.audio_path)
         grain_ms = int(self.grain_sec * 1000)
         grains = split_grains(audio, grain_ms)
@@ -281,7 +335,7 @@ class GrainStep(BaseStep):
         out_path = ctx.output_dir / f"{ctx.input_path.stem}_grain.wav"
         export_wav(assembled, out_path)
 
-        print(f"  ✓ Grain-processed audio saved to {out_path}")
+        logger.info("  ✓ Grain-processed audio saved to %s", out_path)
         ctx.artifacts.grain_wav = out_path
         ctx.extra["grain_path"] = out_path  # backward compat
         ctx.audio_path = out_path  # pipe: next step reads grain audio
@@ -330,7 +384,7 @@ class EnsureMetadataStep(BaseStep):
             action = "migrated" if sidecar_existed else "created"
         else:
             action = "already v1"
-        print(f"  ✓ Metadata sidecar {action}: {json_path}")
+        logger.info("  ✓ Metadata sidecar %s: %s", action, json_path)
         ctx.artifacts.metadata_json = json_path
         return ctx
 
@@ -402,6 +456,15 @@ class SplashStep(BaseStep):
         import matplotlib
         matplotlib.use("Agg")
         import matplotlib.pyplot as plt
+        import numpy as np
+
+        from hydral.analysis.audio_features.io import load_audio_waveform
+        from hydral.analysis.events.splash import (
+            compute_energy_envelope,
+            compute_onset_envelope,
+            detect_splash_events,
+            events_to_dicts,
+        )
 
         effective_sr = ctx.sample_rate if ctx.sample_rate is not None else self.sr
         waveform, sr = load_audio_waveform(ctx.audio_path, target_sample_rate=effective_sr)
@@ -423,7 +486,7 @@ class SplashStep(BaseStep):
         json_path = ctx.output_dir / f"{stem}_splash_events.json"
         with open(json_path, "w", encoding="utf-8") as fh:
             json.dump(events_to_dicts(events), fh, indent=2)
-        print(f"  ✓ Splash events saved to {json_path} ({len(events)} events)")
+        logger.info("  ✓ Splash events saved to %s (%d events)", json_path, len(events))
 
         # ── Save debug PNG ────────────────────────────────────────────────────
         png_path = ctx.output_dir / f"{stem}_splash_debug.png"
@@ -461,7 +524,7 @@ class SplashStep(BaseStep):
         fig.savefig(png_path, dpi=150)
         plt.close(fig)
 
-        print(f"  ✓ Splash debug image saved to {png_path}")
+        logger.info("  ✓ Splash debug image saved to %s", png_path)
 
         ctx.artifacts.splash_events_json = json_path
         ctx.artifacts.splash_debug_png = png_path
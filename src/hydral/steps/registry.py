@@ -50,12 +50,16 @@ class StepRegistry:
         ValueError
             If *name* is not registered.
         """
-        if name not in cls._factories:
-            known = ", ".join(sorted(cls._factories)) or "(none registered)"
-            raise ValueError(
-                f"Unknown step {name!r}. Known steps: {known}"
-            )
-        return cls._factories[name](**(params or {}))
+        factory = cls._factories.get(name)
+        if factory is None:
+            raise cls._unknown(name)
+        return factory(**(params or {}))
+
+    @classmethod
+    def _unknown(cls, name: str) -> ValueError:
+        """Build the error raised by :meth:`build` for an unregistered *name*."""
+        known = ", ".join(sorted(cls._factories)) or "(none registered)"
+        return ValueError(f"Unknown step {name!r}. Known steps: {known}")
 
     @classmethod
     def names(cls) -> List[str]:
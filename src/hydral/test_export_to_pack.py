@@ -0,0 +1,133 @@
+"""Tests for processing/export_to_pack.py."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from hydral._test_utils import touch_many
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    """Count compute_sha256 calls while keeping the real hashing."""
+    import hydral.processing.export_to_pack as export_to_pack
+
+    calls = []
+    real = export_to_pack.compute_sha256
+
+    def counting(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(export_to_pack, "compute_sha256", counting)
+    return calls
+
+
+class TestBuildManifestItemsHashCache:
+    def _build(self, tmp_path, cached_items=None):
+        from hydral.processing.export_to_pack import build_manifest_items
+
+        src_dir = tmp_path / "src"
+        dst_dir = tmp_path / "dst"
+        operations = [
+            (src_dir / "kick.wav", dst_dir / "audio" / "kick.wav", "audio"),
+            (src_dir / "kick.json", dst_dir / "meta" / "kick.json", "meta"),
+        ]
+        items = build_manifest_items(
+            operations, src_dir, dst_dir, group_by_stem=True,
+            use_dst_paths=False, cached_items=cached_items,
+        )
+        return {item["id"]: item for item in items}
+
+    @pytest.fixture
+    def src_wav(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        wav = tmp_path / "src" / "kick.wav"
+        touch_many(tmp_path / "src" / "kick.json")
+        wav.write_bytes(b"RIFF" + b"\0" * 64)
+        return wav
+
+    def test_unchanged_source_reuses_hash(self, tmp_path, src_wav, hash_calls):
+        first = self._build(tmp_path)
+        assert len(hash_calls) == 1
+
+        second = self._build(tmp_path, cached_items=first)
+        assert len(hash_calls) == 1
+        assert second["kick"]["sha256"] == first["kick"]["sha256"]
+        assert second["kick"]["sha256_key"]["path"] == str(src_wav)
+
+    def test_touched_source_is_rehashed(self, tmp_path, src_wav, hash_calls):
+        first = self._build(tmp_path)
+        st = src_wav.stat()
+        os.utime(src_wav, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        self._build(tmp_path, cached_items=first)
+        assert len(hash_calls) == 2
+
+    def test_resized_source_is_rehashed(self, tmp_path, src_wav, hash_calls):
+        first = self._build(tmp_path)
+        st = src_wav.stat()
+        src_wav.write_bytes(src_wav.read_bytes() + b"\0")
+        os.utime(src_wav, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        second = self._build(tmp_path, cached_items=first)
+        assert len(hash_calls) == 2
+        assert second["kick"]["sha256"] != first["kick"]["sha256"]
+
+    def test_sidecar_size_change_does_not_rehash(self, tmp_path, src_wav, hash_calls):
+        first = self._build(tmp_path)
+        (tmp_path / "src" / "kick.json").write_text('{"tags": ["808"]}')
+
+        self._build(tmp_path, cached_items=first)
+        assert len(hash_calls) == 1
+
+
+class TestPerformExportExistingDst:
+    """Re-exporting over an earlier link export must never touch the source."""
+
+    SRC_BYTES = b"RIFF" + bytes(range(256)) * 4
+
+    @pytest.fixture
+    def src_wav(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        wav = tmp_path / "src" / "kick.wav"
+        wav.write_bytes(self.SRC_BYTES)
+        return wav
+
+    @pytest.fixture
+    def dst_wav(self, tmp_path):
+        (tmp_path / "dst").mkdir()
+        return tmp_path / "dst" / "kick.wav"
+
+    def test_hardlink_rerun_keeps_source(self, src_wav, dst_wav):
+        from hydral.processing.export_to_pack import perform_export
+
+        os.link(src_wav, dst_wav)
+        assert perform_export(src_wav, dst_wav, "hardlink", strict=False)
+        assert src_wav.read_bytes() == self.SRC_BYTES
+        assert os.path.samefile(src_wav, dst_wav)
+
+    def test_copy_over_hardlink_keeps_source(self, src_wav, dst_wav):
+        from hydral.processing.export_to_pack import perform_export
+
+        os.link(src_wav, dst_wav)
+        assert perform_export(src_wav, dst_wav, "copy", strict=False)
+        assert src_wav.read_bytes() == self.SRC_BYTES
+        assert dst_wav.read_bytes() == self.SRC_BYTES
+        assert not os.path.samefile(src_wav, dst_wav)
+
+    def test_copy_over_symlink_keeps_source(self, src_wav, dst_wav):
+        from hydral.processing.export_to_pack import perform_export
+
+        dst_wav.symlink_to(src_wav.resolve())
+        assert perform_export(src_wav, dst_wav, "copy", strict=False)
+        assert src_wav.read_bytes() == self.SRC_BYTES
+        assert not dst_wav.is_symlink()
+        assert dst_wav.read_bytes() == self.SRC_BYTES
+
+    def test_same_path_is_rejected(self, src_wav):
+        from hydral.processing.export_to_pack import perform_export
+
+        assert not perform_export(src_wav, src_wav, "copy", strict=False)
+        assert src_wav.read_bytes() == self.SRC_BYTES
@@ -2,28 +2,14 @@
 from __future__ import annotations
 
 import json
-import os
-import sys
 from pathlib import Path
 
-import numpy as np
-import pytest
-import soundfile as sf
-
-# Ensure src/ is on the path (mirrors the pattern used in test_pipeline.py)
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from hydral._test_utils import make_wav, read_json, touch_many
 
 
 # ── helpers ──────────────────────────────────────────────────────────────────
 
 
-def _make_wav(path: Path, duration_sec: float = 1.0, sr: int = 22050) -> None:
-    """Write a simple sine-wave WAV for testing."""
-    t = np.linspace(0, duration_sec, int(sr * duration_sec), dtype=np.float32)
-    audio = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
-    sf.write(str(path), audio, sr)
-
-
 def _run_instagram(argv: list[str]) -> None:
     """Run the instagram subcommand with the given argv."""
     from hydral.__main__ import _build_parser, _cmd_instagram
@@ -41,7 +27,7 @@ def test_instagram_exports_clip_with_correct_duration(tmp_path: Path) -> None:
     from pydub import AudioSegment
 
     src = tmp_path / "track.wav"
-    _make_wav(src, duration_sec=1.0)
+    make_wav(src, duration_sec=1.0)
 
     processed_dir = tmp_path / "processed" / "hydral"
     out_dir = tmp_path / "exports"
@@ -76,7 +62,7 @@ def test_instagram_exports_clip_with_correct_duration(tmp_path: Path) -> None:
 def test_instagram_skips_out_of_range_offsets(tmp_path: Path) -> None:
     """Offsets that exceed the audio length must be skipped (no clip generated)."""
     src = tmp_path / "track.wav"
-    _make_wav(src, duration_sec=1.0)
+    make_wav(src, duration_sec=1.0)
 
     processed_dir = tmp_path / "processed" / "hydral"
     out_dir = tmp_path / "exports"
@@ -108,7 +94,7 @@ def test_instagram_skips_out_of_range_offsets(tmp_path: Path) -> None:
 def test_instagram_dry_run_creates_no_files(tmp_path: Path) -> None:
     """--dry-run must not create any output files."""
     src = tmp_path / "track.wav"
-    _make_wav(src, duration_sec=2.0)
+    make_wav(src, duration_sec=2.0)
 
     processed_dir = tmp_path / "processed" / "hydral"
     out_dir = tmp_path / "exports"
@@ -136,7 +122,7 @@ def test_instagram_dry_run_creates_no_files(tmp_path: Path) -> None:
 def test_instagram_creates_metadata_json(tmp_path: Path) -> None:
     """Each exported clip must have a companion .json metadata file."""
     src = tmp_path / "track.wav"
-    _make_wav(src, duration_sec=2.0)
+    make_wav(src, duration_sec=2.0)
 
     processed_dir = tmp_path / "processed" / "hydral"
     out_dir = tmp_path / "exports"
@@ -164,8 +150,7 @@ def test_instagram_creates_metadata_json(tmp_path: Path) -> None:
     # _index.jsonl is not a .json file, so this counts only clip metadata
     assert len(jsons) == 1, f"Expected 1 metadata JSON, got {len(jsons)}"
 
-    with open(jsons[0], encoding="utf-8") as fh:
-        meta = json.load(fh)
+    meta = read_json(jsons[0])
 
     for key in (
         "source_path",
@@ -185,7 +170,7 @@ def test_instagram_creates_metadata_json(tmp_path: Path) -> None:
 def test_instagram_creates_index_jsonl(tmp_path: Path) -> None:
     """_index.jsonl must contain one line per exported clip."""
     src = tmp_path / "track.wav"
-    _make_wav(src, duration_sec=2.0)
+    make_wav(src, duration_sec=2.0)
 
     processed_dir = tmp_path / "processed" / "hydral"
     out_dir = tmp_path / "exports"
@@ -218,13 +203,13 @@ def test_instagram_creates_index_jsonl(tmp_path: Path) -> None:
 def test_instagram_reuses_existing_normalized(tmp_path: Path) -> None:
     """If the normalized file already exists, it must be reused (not re-created)."""
     src = tmp_path / "track.wav"
-    _make_wav(src, duration_sec=2.0)
+    make_wav(src, duration_sec=2.0)
 
     stem = src.stem
     processed_dir = tmp_path / "processed" / "hydral"
     normalized_path = processed_dir / stem / f"{stem}_normalized.wav"
     normalized_path.parent.mkdir(parents=True)
-    _make_wav(normalized_path, duration_sec=2.0)
+    make_wav(normalized_path, duration_sec=2.0)
 
     mtime_before = normalized_path.stat().st_mtime
 
@@ -259,9 +244,7 @@ def test_instagram_glob_collects_recursive(tmp_path: Path) -> None:
 
     sub = tmp_path / "sub"
     sub.mkdir()
-    (sub / "a.wav").touch()
-    (tmp_path / "b.wav").touch()
-    (tmp_path / "ignore.txt").touch()
+    touch_many(sub / "a.wav", tmp_path / "b.wav", tmp_path / "ignore.txt")
 
     results = _collect_inputs_glob(tmp_path, ["**/*.wav"])
     assert len(results) == 2
@@ -271,7 +254,7 @@ def test_instagram_glob_collects_recursive(tmp_path: Path) -> None:
 def test_instagram_limit(tmp_path: Path) -> None:
     """--limit N must process only N input files."""
     for i in range(3):
-        _make_wav(tmp_path / f"track{i}.wav", duration_sec=1.0)
+        make_wav(tmp_path / f"track{i}.wav", duration_sec=1.0)
 
     processed_dir = tmp_path / "processed" / "hydral"
     out_dir = tmp_path / "exports"
@@ -299,7 +282,3 @@ def test_instagram_limit(tmp_path: Path) -> None:
 
     clips = list(out_dir.glob("*.wav"))
     assert len(clips) == 2, f"Expected 2 clips (limit=2), got {len(clips)}"
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
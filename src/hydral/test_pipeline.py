@@ -7,27 +7,85 @@ Tests focus on:
 - Step Protocol conformance
 """
 import json
-import sys
 import os
 from pathlib import Path
-
-# Ensure src/ is on the path (mirrors the pattern used in songmaking tests)
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from string import Template
 
 import numpy as np
 import soundfile as sf
 import pytest
 
+from hydral.__main__ import _collect_inputs
+from hydral._test_utils import make_header_only_wav, make_wav, read_json, touch_many
+from hydral.artifacts import Artifacts
 from hydral.pipeline import Pipeline, PipelineContext, Step
+from hydral.steps import AnalyzeStep, BandSplitStep, GrainStep, NormalizeStep
+from hydral.steps.registry import StepRegistry
+from hydral.yaml_runner import (
+    PipelineConfig,
+    StepConfig,
+    build_step,
+    collect_inputs,
+    load_config,
+    load_config_from_mapping,
+    run_pipeline,
+    run_pipeline_from_config,
+)
 
 
 # ── helpers ─────────────────────────────────────────────────────────────────
 
-def _make_wav(path: Path, duration_sec: float = 1.0, sr: int = 22050) -> None:
-    """Write a simple sine-wave WAV for testing."""
-    t = np.linspace(0, duration_sec, int(sr * duration_sec), dtype=np.float32)
-    audio = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
-    sf.write(str(path), audio, sr)
+@pytest.fixture(scope="session")
+def tone_wav(tmp_path_factory) -> Path:
+    """1 s test tone shared by tests that only read their input WAV."""
+    path = tmp_path_factory.mktemp("tones") / "tone.wav"
+    make_wav(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def tone_wav_2s(tmp_path_factory) -> Path:
+    """2 s variant of :func:`tone_wav` for GrainStep tests."""
+    path = tmp_path_factory.mktemp("tones") / "tone.wav"
+    make_wav(path, duration_sec=2.0)
+    return path
+
+
+@pytest.fixture
+def fast_export_wav(monkeypatch):
+    """Replace the pydub WAV encode with a header-only write.
+
+    Opt-in for tests that only check paths/artifacts; never use it where the
+    written file is inspected (test_grain_step_creates_wav exports for real).
+    """
+    monkeypatch.setattr(
+        "hydral.infra.audio.export_wav",
+        lambda audio, path: make_header_only_wav(Path(path)),
+    )
+
+
+def _one_report(runs_dir: Path) -> Path:
+    """Return the single ``run_*.json`` report in *runs_dir* (one scandir pass)."""
+    with os.scandir(runs_dir) as it:
+        names = [e.name for e in it if e.name.startswith("run_") and e.name.endswith(".json")]
+    assert len(names) == 1, f"expected exactly one run report, found {names}"
+    return runs_dir / names[0]
+
+
+def _find_cache_manifests(output_root: Path, stem: str) -> list[Path]:
+    """Return ``runs/<run_id>/<stem>/.cache/manifest.json`` files under *output_root*."""
+    with os.scandir(output_root / "runs") as it:
+        candidates = [
+            Path(e.path, stem, ".cache", "manifest.json")
+            for e in it if e.is_dir()
+        ]
+    return [p for p in candidates if p.is_file()]
+
+
+def _peak_db(path: Path) -> float:
+    """Return the peak level of *path* in dBFS."""
+    samples, _ = sf.read(str(path), dtype="float32")
+    return 20 * np.log10(np.abs(samples).max())
 
 
 # ── PipelineContext ──────────────────────────────────────────────────────────
@@ -69,19 +127,16 @@ def test_step_protocol_conformance():
 
 # ── AnalyzeStep ──────────────────────────────────────────────────────────────
 
-def test_analyze_step_creates_json(tmp_path):
-    wav = tmp_path / "tone.wav"
-    _make_wav(wav)
+def test_analyze_step_creates_json(tmp_path, tone_wav):
+    wav = tone_wav
     out_dir = tmp_path / "out"
 
-    from hydral.steps import AnalyzeStep
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     AnalyzeStep().run(ctx)
 
     json_path = out_dir / "tone_features.json"
     assert json_path.exists(), "features JSON not created"
-    with open(json_path) as fh:
-        data = json.load(fh)
+    data = read_json(json_path)
     assert "rms" in data
     assert "low" in data
     assert "mid" in data
@@ -92,21 +147,40 @@ def test_analyze_step_creates_json(tmp_path):
     assert ctx.extra.get("features_path") == json_path
 
 
+def test_fused_features_match_separate_extractors():
+    """extract_all_features must agree with the per-feature librosa helpers."""
+    from hydral.analysis.audio_features.bands import extract_frequency_band_energies
+    from hydral.analysis.audio_features.etract_energy import extract_rms_energy
+    from hydral.analysis.audio_features.fused import extract_all_features
+    from hydral.analysis.audio_features.onset import extract_onset_strength
+
+    sr = 22050
+    rng = np.random.default_rng(0)
+    waveform = (0.1 * rng.standard_normal(sr)).astype(np.float32)
+
+    fused = extract_all_features(waveform, sr, hop_length=512)
+    bands = extract_frequency_band_energies(waveform, sr, hop_length=512)
+
+    np.testing.assert_allclose(fused["rms"], extract_rms_energy(waveform, hop_length=512), rtol=1e-4)
+    for k in ("low", "mid", "high"):
+        np.testing.assert_allclose(fused[k], bands[k], rtol=1e-3, atol=1e-5)
+    np.testing.assert_allclose(
+        fused["onset"], extract_onset_strength(waveform, sr, hop_length=512), rtol=1e-3, atol=1e-3
+    )
+
+
 # ── NormalizeStep ────────────────────────────────────────────────────────────
 
-def test_normalize_step_creates_wav(tmp_path):
-    wav = tmp_path / "tone.wav"
-    _make_wav(wav)
+def test_normalize_step_creates_wav(tmp_path, tone_wav):
+    wav = tone_wav
     out_dir = tmp_path / "out"
 
-    from hydral.steps import NormalizeStep
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     NormalizeStep(target_db=-1.0).run(ctx)
 
     out_wav = out_dir / "tone_normalized.wav"
     assert out_wav.exists(), "normalized WAV not created"
-    audio, _ = sf.read(str(out_wav))
-    peak_db = 20 * np.log10(np.abs(audio).max())
+    peak_db = _peak_db(out_wav)
     assert abs(peak_db - (-1.0)) < 0.1, f"Peak {peak_db:.2f} dB, expected -1.0 dB"
 
 
@@ -117,28 +191,25 @@ def test_normalize_step_stereo(tmp_path):
     t = np.linspace(0, 1.0, sr, dtype=np.float32)
     audio = np.stack([0.3 * np.sin(2 * np.pi * 440 * t),
                       0.2 * np.sin(2 * np.pi * 880 * t)], axis=1).astype(np.float32)
-    sf.write(str(wav), audio, sr)
+    sf.write(str(wav), audio, sr, subtype="PCM_16")
     out_dir = tmp_path / "out"
 
-    from hydral.steps import NormalizeStep
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     NormalizeStep(target_db=-1.0).run(ctx)
 
     out_wav = out_dir / "stereo_normalized.wav"
     assert out_wav.exists(), "normalized stereo WAV not created"
-    result, _ = sf.read(str(out_wav))
-    assert result.ndim == 2, "output should be 2-channel"
-    peak_db = 20 * np.log10(np.abs(result).max())
+    assert sf.info(str(out_wav)).channels == 2, "output should be 2-channel"
+    peak_db = _peak_db(out_wav)
     assert abs(peak_db - (-1.0)) < 0.1, f"Stereo peak {peak_db:.2f} dB, expected -1.0 dB"
 
 
 def test_normalize_step_silent_input(tmp_path):
     """NormalizeStep must not raise when input is silent (peak == 0)."""
     wav = tmp_path / "silence.wav"
-    sf.write(str(wav), np.zeros(22050, dtype=np.float32), 22050)
+    sf.write(str(wav), np.zeros(22050, dtype=np.int16), 22050, subtype="PCM_16")
     out_dir = tmp_path / "out"
 
-    from hydral.steps import NormalizeStep
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     NormalizeStep(target_db=-1.0).run(ctx)
 
@@ -150,71 +221,79 @@ def test_normalize_step_silent_input(tmp_path):
 
 # ── GrainStep ────────────────────────────────────────────────────────────────
 
-def test_grain_step_creates_wav(tmp_path):
-    wav = tmp_path / "tone.wav"
-    _make_wav(wav, duration_sec=2.0)
+def test_grain_step_creates_wav(tmp_path, tone_wav_2s):
+    """Real pydub export: the grain WAV must be a readable, non-empty file."""
+    wav = tone_wav_2s
     out_dir = tmp_path / "out"
 
-    from hydral.steps import GrainStep
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     GrainStep(grain_sec=0.5, seed=42).run(ctx)
 
     out_wav = out_dir / "tone_grain.wav"
     assert out_wav.exists(), "grain WAV not created"
+    assert sf.info(str(out_wav)).frames > 0, "grain WAV has no audio frames"
 
 
 # ── _collect_inputs ──────────────────────────────────────────────────────────
 
 def test_collect_inputs_single_file(tmp_path):
-    from hydral.__main__ import _collect_inputs
     wav = tmp_path / "track.wav"
-    wav.touch()
+    touch_many(wav)
     result = _collect_inputs(wav)
     assert result == [wav]
 
 
 def test_collect_inputs_folder(tmp_path):
-    from hydral.__main__ import _collect_inputs
-    (tmp_path / "a.wav").touch()
-    (tmp_path / "b.wav").touch()
-    (tmp_path / "readme.txt").touch()  # should be filtered out
+    # readme.txt should be filtered out
+    touch_many(tmp_path / "a.wav", tmp_path / "b.wav", tmp_path / "readme.txt")
     result = _collect_inputs(tmp_path)
     assert len(result) == 2
     assert all(p.suffix == ".wav" for p in result)
 
 
 def test_collect_inputs_mp3_flac(tmp_path):
-    from hydral.__main__ import _collect_inputs
-    (tmp_path / "a.mp3").touch()
-    (tmp_path / "b.flac").touch()
+    touch_many(tmp_path / "a.mp3", tmp_path / "b.flac")
     result = _collect_inputs(tmp_path)
     assert len(result) == 2
 
 
 # ── yaml_runner ──────────────────────────────────────────────────────────────
 
+# Single-step normalize pipeline; only the paths vary per test
+_PIPELINE_YAML_TMPL = Template(
+    "pipeline:\n"
+    "  name: test\n"
+    "  input: $wav\n"
+    "  output: $out\n"
+    "  steps:\n"
+    "    - name: normalize\n"
+    "      enabled: $enabled\n"
+    "      params:\n"
+    "        target_db: -1.0\n"
+)
+
+
+_CONFIG_YAML = (
+    "pipeline:\n"
+    "  name: test_pipeline\n"
+    "  input: data/raw\n"
+    "  output: data/processed/hydral\n"
+    "  steps:\n"
+    "    - name: normalize\n"
+    "      enabled: true\n"
+    "      params:\n"
+    "        target_db: -1.0\n"
+    "    - name: analyze\n"
+    "      enabled: false\n"
+)
+
+
 def _write_pipeline_yaml(path: Path, extra: str = "") -> None:
     """Write a minimal pipeline YAML for testing."""
-    path.write_text(
-        "pipeline:\n"
-        "  name: test_pipeline\n"
-        "  input: data/raw\n"
-        "  output: data/processed/hydral\n"
-        "  steps:\n"
-        "    - name: normalize\n"
-        "      enabled: true\n"
-        "      params:\n"
-        "        target_db: -1.0\n"
-        "    - name: analyze\n"
-        "      enabled: false\n"
-        + extra,
-        encoding="utf-8",
-    )
+    path.write_bytes((_CONFIG_YAML + extra).encode("utf-8"))
 
 
 def test_load_config(tmp_path):
-    from hydral.yaml_runner import load_config, PipelineConfig
-
     cfg_file = tmp_path / "pipeline.yaml"
     _write_pipeline_yaml(cfg_file)
     cfg = load_config(cfg_file)
@@ -227,38 +306,57 @@ def test_load_config(tmp_path):
     assert cfg.steps[1].enabled is False
 
 
-def test_collect_inputs_yaml_runner_file(tmp_path):
-    from hydral.yaml_runner import collect_inputs
+def test_load_config_memoizes_unchanged_file(tmp_path):
+    cfg_file = tmp_path / "pipeline.yaml"
+    _write_pipeline_yaml(cfg_file)
+    first = load_config(cfg_file)
+    second = load_config(cfg_file)
+    assert second == first
+    assert second is not first
+
+    # Callers get independent copies: mutating one must not leak into the memo
+    first.steps[0].params["target_db"] = -6.0
+    first.steps.clear()
+    third = load_config(cfg_file)
+    assert len(third.steps) == 2
+    assert third.steps[0].params["target_db"] == -1.0
+
+    _write_pipeline_yaml(cfg_file, "    - name: grain\n      enabled: true\n")
+    st = cfg_file.stat()
+    os.utime(cfg_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert len(load_config(cfg_file).steps) == 3
+
+
+def test_load_config_writes_nothing_next_to_yaml(tmp_path):
+    """Loading a config must not leave cache files in the user's config dir."""
+    cfg_file = tmp_path / "pipeline.yaml"
+    _write_pipeline_yaml(cfg_file)
+    load_config(cfg_file)
+    load_config(cfg_file)
+    assert [p.name for p in tmp_path.iterdir()] == ["pipeline.yaml"]
 
+
+def test_collect_inputs_yaml_runner_file(tmp_path):
     wav = tmp_path / "track.wav"
-    wav.touch()
+    touch_many(wav)
     result = collect_inputs(wav, ["**/*.wav"])
     assert result == [wav]
 
 
 def test_collect_inputs_yaml_runner_recursive(tmp_path):
-    from hydral.yaml_runner import collect_inputs
-
     sub = tmp_path / "sub"
     sub.mkdir()
-    (sub / "a.wav").touch()
-    (sub / "b.flac").touch()
-    (tmp_path / "c.wav").touch()
+    touch_many(sub / "a.wav", sub / "b.flac", tmp_path / "c.wav")
     result = collect_inputs(tmp_path, ["**/*.wav", "**/*.flac"])
     assert len(result) == 3
 
 
 def test_collect_inputs_yaml_runner_missing_dir(tmp_path):
-    from hydral.yaml_runner import collect_inputs
-
     result = collect_inputs(tmp_path / "missing", ["**/*.wav"])
     assert result == []
 
 
 def test_build_step_known_names():
-    from hydral.yaml_runner import StepConfig, build_step
-    from hydral.steps import AnalyzeStep, BandSplitStep, GrainStep, NormalizeStep
-
     assert isinstance(build_step(StepConfig("analyze")), AnalyzeStep)
     assert isinstance(build_step(StepConfig("normalize")), NormalizeStep)
     assert isinstance(build_step(StepConfig("band_split")), BandSplitStep)
@@ -266,46 +364,31 @@ def test_build_step_known_names():
 
 
 def test_build_step_unknown_raises():
-    from hydral.yaml_runner import StepConfig, build_step
-
     with pytest.raises(ValueError, match="Unknown step"):
         build_step(StepConfig("nonexistent"))
 
 
 def test_run_pipeline_normalize_only(tmp_path):
-    """Integration: run_pipeline with a single normalize step."""
+    """Integration: run_pipeline_from_config with a single normalize step."""
     wav = tmp_path / "raw" / "tone.wav"
     wav.parent.mkdir(parents=True)
-    _make_wav(wav)
+    make_wav(wav)
 
     out_root = tmp_path / "out"
-    cfg_file = tmp_path / "pipeline.yaml"
-    cfg_file.write_text(
-        f"pipeline:\n"
-        f"  name: test\n"
-        f"  input: {wav}\n"
-        f"  output: {out_root}\n"
-        f"  steps:\n"
-        f"    - name: normalize\n"
-        f"      enabled: true\n"
-        f"      params:\n"
-        f"        target_db: -1.0\n",
-        encoding="utf-8",
+    config = PipelineConfig(
+        name="test",
+        input=str(wav),
+        output=str(out_root),
+        steps=[StepConfig("normalize", enabled=True, params={"target_db": -1.0})],
     )
 
-    from hydral.yaml_runner import run_pipeline
-
-    run_pipeline(cfg_file)
+    run_pipeline_from_config(config)
 
     normalized = out_root / "tone" / "tone_normalized.wav"
     assert normalized.exists(), "normalized WAV not created"
 
     runs_dir = out_root / "_runs"
-    reports = list(runs_dir.glob("run_*.json"))
-    assert len(reports) == 1
-
-    with open(reports[0], encoding="utf-8") as fh:
-        report = json.load(fh)
+    report = read_json(_one_report(runs_dir))
 
     assert report["pipeline_name"] == "test"
     assert len(report["files"]) == 1
@@ -318,93 +401,169 @@ def test_run_pipeline_normalize_only(tmp_path):
 def test_run_pipeline_disabled_step(tmp_path):
     """Disabled steps should appear in report with status 'skipped_disabled'."""
     wav = tmp_path / "tone.wav"
-    _make_wav(wav)
+    make_wav(wav)
 
     out_root = tmp_path / "out"
-    cfg_file = tmp_path / "pipeline.yaml"
-    cfg_file.write_text(
-        f"pipeline:\n"
-        f"  name: test\n"
-        f"  input: {wav}\n"
-        f"  output: {out_root}\n"
-        f"  steps:\n"
-        f"    - name: normalize\n"
-        f"      enabled: false\n",
-        encoding="utf-8",
+    config = PipelineConfig(
+        name="test",
+        input=str(wav),
+        output=str(out_root),
+        steps=[StepConfig("normalize", enabled=False)],
     )
 
-    from hydral.yaml_runner import run_pipeline
-
-    run_pipeline(cfg_file)
+    run_pipeline_from_config(config)
 
     runs_dir = out_root / "_runs"
-    reports = list(runs_dir.glob("run_*.json"))
-    assert len(reports) == 1
-    with open(reports[0], encoding="utf-8") as fh:
-        report = json.load(fh)
+    report = read_json(_one_report(runs_dir))
 
     skipped = [s for s in report["files"][0]["steps"] if s["status"] == "skipped_disabled"]
     assert len(skipped) == 1
+    assert report["status"] == "completed"
+    assert report["error"] is None
+
+
+def test_run_file_routes_step_logs_through_emit(tmp_path, tone_wav):
+    """Step "✓ saved" lines reach emit (and so the --jobs buffers) unconfigured."""
+    from hydral.yaml_runner import _build_steps, _run_file
+
+    step_cfgs = [StepConfig("normalize", enabled=True)]
+    lines: list[str] = []
+    _run_file(
+        tone_wav, step_cfgs, _build_steps(step_cfgs), tmp_path / "out", "r0",
+        emit=lines.append,
+    )
+
+    assert any("Normalized audio saved" in line for line in lines)
+
+
+def test_run_pipeline_no_inputs_writes_no_report(tmp_path):
+    out_root = tmp_path / "out"
+    config = PipelineConfig(
+        name="test",
+        input=str(tmp_path / "empty"),
+        output=str(out_root),
+        steps=[StepConfig("normalize", enabled=True)],
+    )
+
+    run_pipeline_from_config(config)
+
+    assert not (out_root / "_runs").exists()
+
+
+def test_report_writer_without_files_is_valid_json(tmp_path):
+    from hydral.yaml_runner import RunReport, _ReportWriter
+
+    report = RunReport(
+        run_id="r0", pipeline_name="test", config_path="<in-memory>", started_at="t0"
+    )
+    writer = _ReportWriter(report, tmp_path)
+    report.status = "completed"
+    doc = read_json(writer.close(report))
+
+    assert doc["files"] == []
+    assert doc["status"] == "completed"
+    assert writer.total == 0
+
+
+def test_run_pipeline_closes_report_when_run_aborts(tmp_path, monkeypatch):
+    """An exception escaping the file loop still leaves a complete report."""
+    import hydral.yaml_runner as yaml_runner
+
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    for stem in ("a", "b"):
+        make_header_only_wav(in_dir / f"{stem}.wav")
+
+    real_run_file = yaml_runner._run_file
+
+    def run_file(audio_file, *args, **kwargs):
+        if audio_file.stem == "b":
+            raise RuntimeError("boom")
+        return real_run_file(audio_file, *args, **kwargs)
+
+    monkeypatch.setattr(yaml_runner, "_run_file", run_file)
+    out_root = tmp_path / "out"
+    config = PipelineConfig(
+        name="test",
+        input=str(in_dir),
+        output=str(out_root),
+        steps=[StepConfig("normalize", enabled=False)],
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_pipeline_from_config(config)
+
+    report = read_json(_one_report(out_root / "_runs"))
+    assert [Path(f["input"]).stem for f in report["files"]] == ["a"]
+    assert report["status"] == "aborted"
+    assert report["error"] == "RuntimeError: boom"
+    assert report["finished_at"]
+
+
+def test_run_pipeline_parallel_jobs_keeps_input_order(tmp_path):
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    for stem in ("a", "b", "c"):
+        make_wav(in_dir / f"{stem}.wav")
+
+    out_root = tmp_path / "out"
+    config = PipelineConfig(
+        name="test",
+        input=str(in_dir),
+        output=str(out_root),
+        steps=[StepConfig("normalize", enabled=True)],
+    )
+    run_pipeline_from_config(config, jobs=2)
+
+    report = read_json(_one_report(out_root / "_runs"))
+    assert [Path(f["input"]).stem for f in report["files"]] == ["a", "b", "c"]
+    assert all(f["status"] == "success" for f in report["files"])
+    for stem in ("a", "b", "c"):
+        assert (out_root / stem / f"{stem}_normalized.wav").exists()
 
 
 def test_run_pipeline_skips_existing_output(tmp_path):
     """A step whose output already exists should be skipped."""
     wav = tmp_path / "tone.wav"
-    _make_wav(wav)
+    make_wav(wav)
 
     out_root = tmp_path / "out"
-    cfg_file = tmp_path / "pipeline.yaml"
-    cfg_file.write_text(
-        f"pipeline:\n"
-        f"  name: test\n"
-        f"  input: {wav}\n"
-        f"  output: {out_root}\n"
-        f"  steps:\n"
-        f"    - name: normalize\n"
-        f"      enabled: true\n",
-        encoding="utf-8",
+    config = PipelineConfig(
+        name="test",
+        input=str(wav),
+        output=str(out_root),
+        steps=[StepConfig("normalize", enabled=True)],
     )
 
     # Pre-create the output so the step is skipped
     pre_out = out_root / "tone" / "tone_normalized.wav"
     pre_out.parent.mkdir(parents=True)
-    _make_wav(pre_out)
-
-    from hydral.yaml_runner import run_pipeline
+    make_wav(pre_out)
 
-    run_pipeline(cfg_file)
+    run_pipeline_from_config(config)
 
     runs_dir = out_root / "_runs"
-    reports = list(runs_dir.glob("run_*.json"))
-    with open(reports[0], encoding="utf-8") as fh:
-        report = json.load(fh)
+    report = read_json(_one_report(runs_dir))
 
     skipped = [s for s in report["files"][0]["steps"] if s["status"] == "skipped_exists"]
     assert len(skipped) == 1
 
 
-def test_output_exists_methods(tmp_path):
+@pytest.mark.parametrize("step_cls", [NormalizeStep, AnalyzeStep])
+def test_output_exists_methods(tmp_path, tone_wav, step_cls):
     """output_exists() returns False before creation and True after."""
-    from hydral.pipeline import PipelineContext
-    from hydral.steps import AnalyzeStep, GrainStep, NormalizeStep
-
-    wav = tmp_path / "tone.wav"
-    _make_wav(wav)
-    ctx = PipelineContext(input_path=wav, output_dir=tmp_path / "out")
+    ctx = PipelineContext(input_path=tone_wav, output_dir=tmp_path / "out")
+    step = step_cls()
 
-    normalize = NormalizeStep()
-    analyze = AnalyzeStep()
-    grain = GrainStep()
+    assert step.output_exists(ctx) is False
+    step.run(ctx)
+    assert step.output_exists(ctx) is True
 
-    assert normalize.output_exists(ctx) is False
-    assert analyze.output_exists(ctx) is False
-    assert grain.output_exists(ctx) is False
 
-    normalize.run(ctx)
-    assert normalize.output_exists(ctx) is True
-
-    analyze.run(ctx)
-    assert analyze.output_exists(ctx) is True
+def test_grain_output_exists_false_before_run(tmp_path, tone_wav):
+    """GrainStep.output_exists() is False while no grain WAV has been written."""
+    ctx = PipelineContext(input_path=tone_wav, output_dir=tmp_path / "out")
+    assert GrainStep().output_exists(ctx) is False
 
 
 # ── New: PipelineContext audio_path and artifacts ────────────────────────────
@@ -418,8 +577,6 @@ def test_pipeline_context_audio_path_defaults_to_input(tmp_path):
 
 def test_pipeline_context_artifacts_defaults_empty(tmp_path):
     """artifacts must be an Artifacts instance with all fields None."""
-    from hydral.artifacts import Artifacts
-
     ctx = PipelineContext(input_path=tmp_path / "in.wav", output_dir=tmp_path / "out")
     assert isinstance(ctx.artifacts, Artifacts)
     assert ctx.artifacts.features_json is None
@@ -429,14 +586,11 @@ def test_pipeline_context_artifacts_defaults_empty(tmp_path):
     assert ctx.artifacts.band_dir is None
 
 
-def test_normalize_step_updates_audio_path(tmp_path):
+def test_normalize_step_updates_audio_path(tmp_path, tone_wav):
     """NormalizeStep must update ctx.audio_path to the normalised file."""
-    wav = tmp_path / "tone.wav"
-    _make_wav(wav)
+    wav = tone_wav
     out_dir = tmp_path / "out"
 
-    from hydral.steps import NormalizeStep
-
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     assert ctx.audio_path == wav
 
@@ -448,63 +602,51 @@ def test_normalize_step_updates_audio_path(tmp_path):
     )
 
 
-def test_normalize_step_fills_artifacts(tmp_path):
+def test_normalize_step_fills_artifacts(tmp_path, tone_wav):
     """NormalizeStep must fill ctx.artifacts.normalized_wav."""
-    wav = tmp_path / "tone.wav"
-    _make_wav(wav)
+    wav = tone_wav
     out_dir = tmp_path / "out"
 
-    from hydral.steps import NormalizeStep
-
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     NormalizeStep().run(ctx)
 
     assert ctx.artifacts.normalized_wav == out_dir / "tone_normalized.wav"
 
 
-def test_analyze_step_fills_artifacts(tmp_path):
+def test_analyze_step_fills_artifacts(tmp_path, tone_wav):
     """AnalyzeStep must fill ctx.artifacts.features_json."""
-    wav = tmp_path / "tone.wav"
-    _make_wav(wav)
+    wav = tone_wav
     out_dir = tmp_path / "out"
 
-    from hydral.steps import AnalyzeStep
-
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     AnalyzeStep().run(ctx)
 
     assert ctx.artifacts.features_json == out_dir / "tone_features.json"
 
 
-def test_analyze_step_does_not_update_audio_path(tmp_path):
+def test_analyze_step_does_not_update_audio_path(tmp_path, tone_wav):
     """AnalyzeStep must NOT change ctx.audio_path (analysis is non-destructive)."""
-    wav = tmp_path / "tone.wav"
-    _make_wav(wav)
+    wav = tone_wav
     out_dir = tmp_path / "out"
 
-    from hydral.steps import AnalyzeStep
-
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     original_audio_path = ctx.audio_path
     AnalyzeStep().run(ctx)
     assert ctx.audio_path == original_audio_path
 
 
-def test_grain_step_fills_artifacts(tmp_path):
+def test_grain_step_fills_artifacts(tmp_path, tone_wav_2s, fast_export_wav):
     """GrainStep must fill ctx.artifacts.grain_wav."""
-    wav = tmp_path / "tone.wav"
-    _make_wav(wav, duration_sec=2.0)
+    wav = tone_wav_2s
     out_dir = tmp_path / "out"
 
-    from hydral.steps import GrainStep
-
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     GrainStep(grain_sec=0.5, seed=42).run(ctx)
 
     assert ctx.artifacts.grain_wav == out_dir / "tone_grain.wav"
 
 
-def test_normalize_grain_piping(tmp_path):
+def test_normalize_grain_piping(tmp_path, tone_wav_2s):
     """normalize → grain chain: grain must read from normalised audio.
 
     The piping contract is: after NormalizeStep runs, ctx.audio_path points
@@ -512,12 +654,9 @@ def test_normalize_grain_piping(tmp_path):
     without executing GrainStep.run() (which requires ffprobe via pydub when
     loading a 32-bit float WAV written by NormalizeStep).
     """
-    wav = tmp_path / "tone.wav"
-    _make_wav(wav, duration_sec=2.0)
+    wav = tone_wav_2s
     out_dir = tmp_path / "out"
 
-    from hydral.steps import GrainStep, NormalizeStep
-
     ctx = PipelineContext(input_path=wav, output_dir=out_dir)
     NormalizeStep(target_db=-1.0).run(ctx)
 
@@ -537,37 +676,27 @@ def test_normalize_grain_piping(tmp_path):
 
 # ── New: StepRegistry ────────────────────────────────────────────────────────
 
-def test_step_registry_known_names():
-    """Built-in steps must be registered in StepRegistry."""
-    from hydral.steps.registry import StepRegistry
-
-    assert "analyze" in StepRegistry.names()
-    assert "normalize" in StepRegistry.names()
-    assert "band_split" in StepRegistry.names()
-    assert "grain" in StepRegistry.names()
-
-
-def test_step_registry_build_returns_correct_types():
-    from hydral.steps import AnalyzeStep, BandSplitStep, GrainStep, NormalizeStep
-    from hydral.steps.registry import StepRegistry
-
-    assert isinstance(StepRegistry.build("analyze"), AnalyzeStep)
-    assert isinstance(StepRegistry.build("normalize"), NormalizeStep)
-    assert isinstance(StepRegistry.build("band_split"), BandSplitStep)
-    assert isinstance(StepRegistry.build("grain"), GrainStep)
+@pytest.mark.parametrize(
+    "name, cls",
+    [
+        ("analyze", AnalyzeStep),
+        ("normalize", NormalizeStep),
+        ("band_split", BandSplitStep),
+        ("grain", GrainStep),
+    ],
+)
+def test_step_registry_builtin(name, cls):
+    """Built-in steps must be registered and build the matching class."""
+    assert name in StepRegistry.names()
+    assert isinstance(StepRegistry.build(name), cls)
 
 
 def test_step_registry_build_unknown_raises():
-    from hydral.steps.registry import StepRegistry
-
     with pytest.raises(ValueError, match="Unknown step"):
         StepRegistry.build("nonexistent_xyz")
 
 
 def test_step_registry_build_passes_params():
-    from hydral.steps import NormalizeStep
-    from hydral.steps.registry import StepRegistry
-
     step = StepRegistry.build("normalize", {"target_db": -6.0})
     assert isinstance(step, NormalizeStep)
     assert step.target_db == -6.0
@@ -577,12 +706,11 @@ def test_step_registry_build_passes_params():
 
 def test_base_step_fingerprint_is_json_serialisable(tmp_path):
     """fingerprint() must return a JSON-serialisable dict."""
+    # fingerprint() only stats the input, so an empty file is enough
     wav = tmp_path / "tone.wav"
-    _make_wav(wav)
+    touch_many(wav)
     ctx = PipelineContext(input_path=wav, output_dir=tmp_path / "out")
 
-    from hydral.steps import NormalizeStep
-
     step = NormalizeStep(target_db=-3.0)
     fp = step.fingerprint(ctx)
 
@@ -596,12 +724,11 @@ def test_base_step_fingerprint_is_json_serialisable(tmp_path):
 
 def test_base_step_fingerprint_includes_params(tmp_path):
     """Different params must produce different fingerprints."""
+    # fingerprint() only stats the input, so an empty file is enough
     wav = tmp_path / "tone.wav"
-    _make_wav(wav)
+    touch_many(wav)
     ctx = PipelineContext(input_path=wav, output_dir=tmp_path / "out")
 
-    from hydral.steps import NormalizeStep
-
     fp1 = NormalizeStep(target_db=-1.0).fingerprint(ctx)
     fp2 = NormalizeStep(target_db=-6.0).fingerprint(ctx)
     assert fp1["params"]["target_db"] != fp2["params"]["target_db"]
@@ -611,53 +738,29 @@ def test_base_step_fingerprint_includes_params(tmp_path):
 
 def test_load_config_missing_file(tmp_path):
     """load_config must raise FileNotFoundError for missing files."""
-    from hydral.yaml_runner import load_config
-
     with pytest.raises(FileNotFoundError):
         load_config(tmp_path / "missing.yaml")
 
 
 def test_load_config_missing_pipeline_key(tmp_path):
     """load_config must raise ValueError if 'pipeline' key is absent."""
-    from hydral.yaml_runner import load_config
-
     cfg = tmp_path / "bad.yaml"
     cfg.write_text("name: test\n", encoding="utf-8")
     with pytest.raises(ValueError, match="top-level 'pipeline' key"):
         load_config(cfg)
 
 
-def test_load_config_unknown_step_name_raises(tmp_path):
-    """load_config must raise ValueError for unknown step names."""
-    from hydral.yaml_runner import load_config
-
-    cfg = tmp_path / "bad.yaml"
-    cfg.write_text(
-        "pipeline:\n"
-        "  name: test\n"
-        "  steps:\n"
-        "    - name: nonexistent_xyz\n"
-        "      enabled: true\n",
-        encoding="utf-8",
-    )
+def test_load_config_unknown_step_name_raises():
+    """Config validation must raise ValueError for unknown step names."""
+    raw = {"pipeline": {"name": "test", "steps": [{"name": "nonexistent_xyz", "enabled": True}]}}
     with pytest.raises(ValueError, match="Unknown step"):
-        load_config(cfg)
+        load_config_from_mapping(raw)
 
 
-def test_load_config_disabled_unknown_step_is_allowed(tmp_path):
+def test_load_config_disabled_unknown_step_is_allowed():
     """Disabled steps with unknown names should not raise (they won't run)."""
-    from hydral.yaml_runner import load_config
-
-    cfg = tmp_path / "ok.yaml"
-    cfg.write_text(
-        "pipeline:\n"
-        "  name: test\n"
-        "  steps:\n"
-        "    - name: nonexistent_xyz\n"
-        "      enabled: false\n",
-        encoding="utf-8",
-    )
-    result = load_config(cfg)
+    raw = {"pipeline": {"name": "test", "steps": [{"name": "nonexistent_xyz", "enabled": False}]}}
+    result = load_config_from_mapping(raw)
     assert result.steps[0].name == "nonexistent_xyz"
     assert result.steps[0].enabled is False
 
@@ -668,38 +771,22 @@ def test_run_pipeline_writes_cache_manifest(tmp_path):
     """run_pipeline must write a .cache/manifest.json under runs/<run_id>/<stem>/."""
     wav = tmp_path / "raw" / "tone.wav"
     wav.parent.mkdir(parents=True)
-    _make_wav(wav)
+    make_wav(wav)
 
     out_root = tmp_path / "out"
     cfg_file = tmp_path / "pipeline.yaml"
-    cfg_file.write_text(
-        f"pipeline:\n"
-        f"  name: test\n"
-        f"  input: {wav}\n"
-        f"  output: {out_root}\n"
-        f"  steps:\n"
-        f"    - name: normalize\n"
-        f"      enabled: true\n"
-        f"      params:\n"
-        f"        target_db: -1.0\n",
-        encoding="utf-8",
+    cfg_file.write_bytes(
+        _PIPELINE_YAML_TMPL.substitute(wav=wav, out=out_root, enabled="true").encode("utf-8")
     )
 
-    from hydral.yaml_runner import run_pipeline
-
     run_pipeline(cfg_file)
 
     # Cache manifests live under runs/<run_id>/<stem>/.cache/manifest.json
-    manifests = list(out_root.glob("runs/*/tone/.cache/manifest.json"))
+    manifests = _find_cache_manifests(out_root, "tone")
     assert len(manifests) == 1, "Expected exactly one cache manifest"
 
-    with open(manifests[0], encoding="utf-8") as fh:
-        manifest = json.load(fh)
+    manifest = read_json(manifests[0])
 
     assert "normalize" in manifest
     assert manifest["normalize"]["step"] == "normalize"
     assert manifest["normalize"]["params"]["target_db"] == -1.0
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
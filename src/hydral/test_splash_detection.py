@@ -4,15 +4,9 @@ All waveforms are generated with numpy – no external WAV files required.
 """
 from __future__ import annotations
 
-import sys
-import os
-
 import numpy as np
 import pytest
 
-# Ensure src/ is on the path (mirrors the pattern used in other hydral tests)
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
-
 from hydral.analysis.events.splash import (
     SplashEvent,
     detect_splash_events,
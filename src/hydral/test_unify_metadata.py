@@ -2,29 +2,12 @@
 from __future__ import annotations
 
 import json
-import os
-import sys
-from pathlib import Path
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
-
-import numpy as np
-import pytest
-import soundfile as sf
+import logging
 
+from hydral._test_utils import make_header_only_wav, make_wav, read_json
 from hydral.pipeline import PipelineContext
 
 
-# ── helpers ──────────────────────────────────────────────────────────────────
-
-
-def _make_wav(path: Path, duration_sec: float = 1.0, sr: int = 22050) -> None:
-    """Write a simple sine-wave WAV for testing."""
-    t = np.linspace(0, duration_sec, int(sr * duration_sec), dtype=np.float32)
-    audio = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
-    sf.write(str(path), audio, sr)
-
-
 # ── unify_metadata module ─────────────────────────────────────────────────────
 
 
@@ -84,7 +67,7 @@ class TestToV1:
         from hydral.processing.unify_metadata import SCHEMA_VERSION, is_v1, to_v1
 
         wav = tmp_path / "test.wav"
-        _make_wav(wav, sr=44100)
+        make_wav(wav, sr=44100)
         doc = to_v1(wav)
         assert doc["schema_version"] == SCHEMA_VERSION
         assert doc["filename"] == "test.wav"
@@ -98,7 +81,7 @@ class TestToV1:
         from hydral.processing.unify_metadata import to_v1
 
         wav = tmp_path / "test.wav"
-        _make_wav(wav)
+        make_header_only_wav(wav)
         doc = to_v1(wav, existing={"tags": ["water", "rain"]})
         assert doc["tags"] == ["water", "rain"]
 
@@ -106,7 +89,7 @@ class TestToV1:
         from hydral.processing.unify_metadata import to_v1
 
         wav = tmp_path / "test.wav"
-        _make_wav(wav, duration_sec=2.0)
+        make_wav(wav, duration_sec=2.0)
         doc = to_v1(wav, existing={"duration": 2.0, "tags": ["x"]})
         assert "duration_sec" in doc
         assert "duration" not in doc
@@ -115,7 +98,7 @@ class TestToV1:
         from hydral.processing.unify_metadata import to_v1
 
         wav = tmp_path / "test.wav"
-        _make_wav(wav)
+        make_header_only_wav(wav)
         doc = to_v1(wav, existing={"rms": -43.0})
         assert doc["mean_rms"] == -43.0
 
@@ -123,7 +106,7 @@ class TestToV1:
         from hydral.processing.unify_metadata import SCHEMA_VERSION, to_v1
 
         wav = tmp_path / "test.wav"
-        _make_wav(wav)
+        make_header_only_wav(wav)
         doc = to_v1(wav, existing={"schema_version": "v0"})
         assert doc["schema_version"] == SCHEMA_VERSION
 
@@ -131,7 +114,7 @@ class TestToV1:
         from hydral.processing.unify_metadata import to_v1
 
         wav = tmp_path / "test.wav"
-        _make_wav(wav)
+        make_header_only_wav(wav)
         doc = to_v1(wav, existing={"filename": "wrong.wav"})
         assert doc["filename"] == "test.wav"
 
@@ -141,13 +124,12 @@ class TestEnsureMetadata:
         from hydral.processing.unify_metadata import SCHEMA_VERSION, ensure_metadata
 
         wav = tmp_path / "track.wav"
-        _make_wav(wav)
+        make_header_only_wav(wav)
         json_path, changed = ensure_metadata(wav)
         assert changed is True
         assert json_path == wav.with_suffix(".json")
         assert json_path.exists()
-        with open(json_path, encoding="utf-8") as fh:
-            doc = json.load(fh)
+        doc = read_json(json_path)
         assert doc["schema_version"] == SCHEMA_VERSION
 
     def test_skips_when_already_v1(self, tmp_path):
@@ -158,7 +140,7 @@ class TestEnsureMetadata:
         )
 
         wav = tmp_path / "track.wav"
-        _make_wav(wav)
+        make_header_only_wav(wav)
         # Pre-create a valid v1 sidecar
         sidecar = wav.with_suffix(".json")
         doc = to_v1(wav)
@@ -172,7 +154,7 @@ class TestEnsureMetadata:
         from hydral.processing.unify_metadata import SCHEMA_VERSION, ensure_metadata
 
         wav = tmp_path / "track.wav"
-        _make_wav(wav)
+        make_header_only_wav(wav)
         # Write a legacy sidecar (no schema_version)
         sidecar = wav.with_suffix(".json")
         with open(sidecar, "w", encoding="utf-8") as fh:
@@ -180,8 +162,7 @@ class TestEnsureMetadata:
 
         json_path, changed = ensure_metadata(wav)
         assert changed is True
-        with open(json_path, encoding="utf-8") as fh:
-            doc = json.load(fh)
+        doc = read_json(json_path)
         assert doc["schema_version"] == SCHEMA_VERSION
         assert doc["tags"] == ["old"]
 
@@ -189,16 +170,45 @@ class TestEnsureMetadata:
         from hydral.processing.unify_metadata import SCHEMA_VERSION, ensure_metadata
 
         wav = tmp_path / "track.wav"
-        _make_wav(wav)
+        make_header_only_wav(wav)
         sidecar = wav.with_suffix(".json")
         sidecar.write_text("not json!", encoding="utf-8")
 
         _, changed = ensure_metadata(wav)
         assert changed is True
-        with open(sidecar, encoding="utf-8") as fh:
-            doc = json.load(fh)
+        doc = read_json(sidecar)
         assert doc["schema_version"] == SCHEMA_VERSION
 
+    def test_repairs_truncated_v1_sidecar(self, tmp_path):
+        from hydral.processing.unify_metadata import SCHEMA_VERSION, ensure_metadata, to_v1
+
+        wav = tmp_path / "track.wav"
+        make_header_only_wav(wav)
+        sidecar = wav.with_suffix(".json")
+        full = json.dumps(to_v1(wav), indent=2)
+        # Every required key is present, but the document is cut off
+        sidecar.write_text(full[: full.index('"tags"') + 12], encoding="utf-8")
+
+        _, changed = ensure_metadata(wav)
+        assert changed is True
+        doc = read_json(sidecar)
+        assert doc["schema_version"] == SCHEMA_VERSION
+        assert doc["tags"] == []
+
+    def test_updates_sidecar_with_nested_required_keys(self, tmp_path):
+        from hydral.processing.unify_metadata import ensure_metadata, is_v1, to_v1
+
+        wav = tmp_path / "track.wav"
+        make_header_only_wav(wav)
+        sidecar = wav.with_suffix(".json")
+        # The v1 keys only appear inside a nested object, not at top level
+        nested = {"schema_version": "v1", "legacy": to_v1(wav)}
+        sidecar.write_text(json.dumps(nested), encoding="utf-8")
+
+        _, changed = ensure_metadata(wav)
+        assert changed is True
+        assert is_v1(read_json(sidecar))
+
 
 class TestMigrateRoot:
     def test_migrates_all_wavs_in_tree(self, tmp_path):
@@ -208,7 +218,7 @@ class TestMigrateRoot:
         sub.mkdir()
         wavs = [tmp_path / "a.wav", sub / "b.wav"]
         for w in wavs:
-            _make_wav(w)
+            make_wav(w)
 
         counts = migrate_root(tmp_path)
         assert counts["created"] == 2
@@ -219,7 +229,7 @@ class TestMigrateRoot:
         from hydral.processing.unify_metadata import ensure_metadata, migrate_root
 
         wav = tmp_path / "track.wav"
-        _make_wav(wav)
+        make_wav(wav)
         ensure_metadata(wav)  # create v1 first
 
         counts = migrate_root(tmp_path)
@@ -230,7 +240,7 @@ class TestMigrateRoot:
         from hydral.processing.unify_metadata import migrate_root
 
         wav = tmp_path / "track.wav"
-        _make_wav(wav)
+        make_wav(wav)
         wav.with_suffix(".json").write_text('{"tags": ["old"]}', encoding="utf-8")
 
         counts = migrate_root(tmp_path)
@@ -238,6 +248,39 @@ class TestMigrateRoot:
         assert counts["created"] == 0
         assert counts["skipped"] == 0
 
+    def test_fast_variant_matches_migrate_root(self, tmp_path):
+        from hydral.processing.unify_metadata import SCHEMA_VERSION, migrate_root_fast
+
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        make_wav(tmp_path / "a.wav")
+        make_wav(sub / "b.wav")
+        (sub / "b.json").write_text('{"tags": ["old"]}', encoding="utf-8")
+
+        counts = migrate_root_fast(tmp_path)
+        assert counts == {"created": 1, "updated": 1, "skipped": 0}
+        doc = read_json(sub / "b.json")
+        assert doc["schema_version"] == SCHEMA_VERSION
+        assert doc["tags"] == ["old"]
+
+        assert migrate_root_fast(tmp_path) == {"created": 0, "updated": 0, "skipped": 2}
+
+    def test_fast_variant_logs_in_sorted_path_order(self, tmp_path, caplog):
+        from hydral.processing.unify_metadata import migrate_root_fast
+
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        # Top-down walking would visit a/z.wav before a/b/c.wav
+        wavs = [tmp_path / "a" / "z.wav", nested / "c.wav", tmp_path / "m.wav"]
+        for w in wavs:
+            make_header_only_wav(w)
+
+        with caplog.at_level(logging.INFO, logger="hydral.processing.unify_metadata"):
+            migrate_root_fast(tmp_path)
+
+        logged = [r.args[0] for r in caplog.records]
+        assert logged == sorted(wavs, key=str)
+
 
 # ── EnsureMetadataStep ─────────────────────────────────────────────────────────
 
@@ -247,14 +290,13 @@ class TestEnsureMetadataStep:
         from hydral.steps import EnsureMetadataStep
 
         wav = tmp_path / "tone.wav"
-        _make_wav(wav)
+        make_wav(wav)
         ctx = PipelineContext(input_path=wav, output_dir=tmp_path / "out")
         EnsureMetadataStep().run(ctx)
 
         sidecar = wav.with_suffix(".json")
         assert sidecar.exists()
-        with open(sidecar, encoding="utf-8") as fh:
-            doc = json.load(fh)
+        doc = read_json(sidecar)
         from hydral.processing.unify_metadata import SCHEMA_VERSION
         assert doc["schema_version"] == SCHEMA_VERSION
 
@@ -262,7 +304,7 @@ class TestEnsureMetadataStep:
         from hydral.steps import EnsureMetadataStep
 
         wav = tmp_path / "tone.wav"
-        _make_wav(wav)
+        make_wav(wav)
         ctx = PipelineContext(input_path=wav, output_dir=tmp_path / "out")
         EnsureMetadataStep().run(ctx)
 
@@ -272,7 +314,7 @@ class TestEnsureMetadataStep:
         from hydral.steps import EnsureMetadataStep
 
         wav = tmp_path / "tone.wav"
-        _make_wav(wav)
+        make_wav(wav)
         ctx = PipelineContext(input_path=wav, output_dir=tmp_path / "out")
         EnsureMetadataStep().run(ctx)
 
@@ -282,7 +324,7 @@ class TestEnsureMetadataStep:
         from hydral.steps import EnsureMetadataStep
 
         wav = tmp_path / "tone.wav"
-        _make_wav(wav)
+        make_wav(wav)
         ctx = PipelineContext(input_path=wav, output_dir=tmp_path / "out")
         step = EnsureMetadataStep()
         assert step.output_exists(ctx) is False
@@ -291,7 +333,7 @@ class TestEnsureMetadataStep:
         from hydral.steps import EnsureMetadataStep
 
         wav = tmp_path / "tone.wav"
-        _make_wav(wav)
+        make_wav(wav)
         ctx = PipelineContext(input_path=wav, output_dir=tmp_path / "out")
         step = EnsureMetadataStep()
         step.run(ctx)
@@ -313,7 +355,7 @@ class TestEnsureMetadataStep:
         """Integration: run_pipeline with ensure_metadata as first step."""
         wav = tmp_path / "raw" / "tone.wav"
         wav.parent.mkdir(parents=True)
-        _make_wav(wav)
+        make_wav(wav)
 
         out_root = tmp_path / "out"
         cfg_file = tmp_path / "pipeline.yaml"
@@ -339,15 +381,10 @@ class TestEnsureMetadataStep:
         # Sidecar should be created next to the input WAV
         sidecar = wav.with_suffix(".json")
         assert sidecar.exists(), "sidecar JSON not created next to input WAV"
-        with open(sidecar, encoding="utf-8") as fh:
-            doc = json.load(fh)
+        doc = read_json(sidecar)
         from hydral.processing.unify_metadata import SCHEMA_VERSION
         assert doc["schema_version"] == SCHEMA_VERSION
 
         # Normalize output should also exist
         normalized = out_root / "tone" / "tone_normalized.wav"
         assert normalized.exists()
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
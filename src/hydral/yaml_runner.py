@@ -10,17 +10,33 @@ Usage::
 """
 from __future__ import annotations
 
+import copy
 import json
+import logging
+import os
+import re
 import time
 import datetime
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from hydral.paths import DATA_ROOT_DIR as _DATA_ROOT
 
 import yaml
 
+# LibYAML-backed loader when PyYAML was built with it; pure-Python otherwise.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Ensure built-in steps are registered in StepRegistry before any build_step call.
 import hydral.steps.builtin  # noqa: F401 – side-effect: registers built-ins
 from hydral.steps.registry import StepRegistry
@@ -28,14 +44,14 @@ from hydral.steps.registry import StepRegistry
 
 # ── Config dataclasses ─────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class StepConfig:
     name: str
     enabled: bool = True
     params: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     name: str = "hydral_default"
     input: str = str(_DATA_ROOT / "data/raw")
@@ -47,8 +63,9 @@ class PipelineConfig:
 
 
 # ── Trace dataclasses ──────────────────────────────────────────────────────
+# slots=True: no per-instance __dict__ for the (files × steps) trace objects.
 
-@dataclass
+@dataclass(slots=True)
 class StepTrace:
     name: str
     status: str  # "ran" | "skipped_disabled" | "skipped_exists" | "failed"
@@ -57,7 +74,7 @@ class StepTrace:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileTrace:
     input: str
     status: str  # "success" | "failed"
@@ -65,22 +82,35 @@ class FileTrace:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunReport:
+    """Run-level report fields; per-file traces are streamed by :class:`_ReportWriter`."""
+
     run_id: str
     pipeline_name: str
     config_path: str
     started_at: str
     finished_at: str = ""
     total_elapsed_sec: float = 0.0
-    files: List[FileTrace] = field(default_factory=list)
+    status: str = "running"  # "completed" | "aborted"
+    error: Optional[str] = None
 
 
 # ── Config loading ─────────────────────────────────────────────────────────
 
+# In-process memo of validated configs: resolved path → ((mtime_ns, size), config).
+# One entry per path, so re-editing a config replaces rather than accumulates.
+# Entries are never handed out directly; load_config returns deep copies.
+_CFG_CACHE: Dict[str, tuple] = {}
+
+
 def load_config(config_path: Path) -> PipelineConfig:
     """Load and parse a pipeline YAML config file.
 
+    Repeated loads of an unchanged file (same ``mtime_ns`` and size) skip
+    the YAML parse and validation.  Each call returns its own copy, so
+    callers may modify the result freely.
+
     Raises
     ------
     FileNotFoundError
@@ -88,11 +118,40 @@ def load_config(config_path: Path) -> PipelineConfig:
     ValueError
         If the YAML is structurally invalid or contains unknown step names.
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    key = str(config_path.resolve())
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CFG_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
 
     with open(config_path, encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh)
+        raw = yaml.load(fh, Loader=_YAML_LOADER)
+
+    config = load_config_from_mapping(raw, config_path)
+    _CFG_CACHE[key] = (stamp, copy.deepcopy(config))
+    return config
+
+
+def load_config_from_mapping(
+    raw: Any, config_path: Optional[Path] = None
+) -> PipelineConfig:
+    """Validate an already-parsed config document and build a :class:`PipelineConfig`.
+
+    *raw* has the same shape as the YAML file (a mapping with a top-level
+    ``pipeline`` key).  *config_path* is only used in error messages.
+
+    Raises
+    ------
+    ValueError
+        If *raw* is structurally invalid or contains unknown step names.
+    """
+    if config_path is None:
+        config_path = Path("<mapping>")
 
     if not isinstance(raw, dict) or "pipeline" not in raw:
         raise ValueError(
@@ -149,11 +208,35 @@ def load_config(config_path: Path) -> PipelineConfig:
 
 # ── Input collection ───────────────────────────────────────────────────────
 
+# "**/*.wav"-style patterns: any depth, fixed (case-sensitive) suffix.
+_RECURSIVE_SUFFIX_RE = re.compile(r"\*\*/\*(\.[^*?\[\]/]+)")
+
+
+def _recursive_suffixes(globs: List[str]) -> Optional[tuple[str, ...]]:
+    """Return the suffixes if every pattern is ``**/*<suffix>``, else ``None``."""
+    suffixes = []
+    for pattern in globs:
+        m = _RECURSIVE_SUFFIX_RE.fullmatch(pattern)
+        if m is None:
+            return None
+        suffixes.append(m.group(1))
+    return tuple(suffixes)
+
+
 def collect_inputs(input_path: Path, globs: List[str]) -> List[Path]:
     """Return sorted list of audio files from *input_path* (file or folder)."""
     if input_path.is_file():
         return [input_path]
     if input_path.is_dir():
+        suffixes = _recursive_suffixes(globs)
+        if suffixes is not None:
+            # Default globs: one os.walk instead of one tree walk per pattern
+            return sorted(
+                Path(dirpath, name)
+                for dirpath, _dirnames, filenames in os.walk(input_path)
+                for name in filenames
+                if name.endswith(suffixes)
+            )
         files: set[Path] = set()
         for pattern in globs:
             files.update(input_path.glob(pattern))
@@ -174,20 +257,68 @@ def build_step(step_cfg: StepConfig):
     return StepRegistry.build(step_cfg.name, step_cfg.params)
 
 
+@dataclass(slots=True)
+class _PlannedStep:
+    """A built step plus its optional hooks, resolved once per run.
+
+    ``fingerprint`` / ``output_exists`` are the step's bound methods, or
+    ``None`` when the step does not provide them.
+    """
+
+    step: Any
+    fingerprint: Optional[Callable[[Any], Dict[str, Any]]]
+    output_exists: Optional[Callable[[Any], bool]]
+
+
+def _build_steps(step_cfgs: List[StepConfig]) -> List[Any]:
+    """Build every enabled step once per run, aligned with *step_cfgs*.
+
+    Each slot holds a :class:`_PlannedStep`, ``None`` for a disabled step, or
+    the ``ValueError`` raised while building it (reported per file, as before).
+    """
+    steps: List[Any] = []
+    for step_cfg in step_cfgs:
+        if not step_cfg.enabled:
+            steps.append(None)
+            continue
+        try:
+            step = build_step(step_cfg)
+        except ValueError as exc:
+            steps.append(exc)
+            continue
+        steps.append(
+            _PlannedStep(
+                step=step,
+                fingerprint=getattr(step, "fingerprint", None),
+                output_exists=getattr(step, "output_exists", None),
+            )
+        )
+    return steps
+
+
 # ── Report helpers ─────────────────────────────────────────────────────────
 
+# Step name → Artifacts attribute holding its primary output.
+_ARTIFACT_MAP = {
+    "analyze": "features_json",
+    "ensure_metadata": "metadata_json",
+    "normalize": "normalized_wav",
+    "grain": "grain_wav",
+    "band_split": "band_dir",
+}
+
+# Step name → legacy ctx.extra key (fallback for steps that predate Artifacts).
+_EXTRA_KEY_MAP = {
+    "analyze": "features_path",
+    "normalize": "normalized_path",
+    "grain": "grain_path",
+    "band_split": "band_split_manifest",
+}
+
+
 def _capture_outputs(step_name: str, ctx, step_trace: StepTrace) -> None:
     """Populate step_trace.outputs from ctx.artifacts (and ctx.extra fallback)."""
-    from hydral.artifacts import Artifacts
-
-    artifact_map = {
-        "analyze": "features_json",
-        "ensure_metadata": "metadata_json",
-        "normalize": "normalized_wav",
-        "grain": "grain_wav",
-        "band_split": "band_dir",
-    }
-    attr = artifact_map.get(step_name)
+    attr = _ARTIFACT_MAP.get(step_name)
     if attr:
         val = getattr(ctx.artifacts, attr, None)
         if val is not None:
@@ -195,13 +326,7 @@ def _capture_outputs(step_name: str, ctx, step_trace: StepTrace) -> None:
             return
 
     # Fallback: legacy ctx.extra string keys
-    key_map = {
-        "analyze": "features_path",
-        "normalize": "normalized_path",
-        "grain": "grain_path",
-        "band_split": "band_split_manifest",
-    }
-    key = key_map.get(step_name)
+    key = _EXTRA_KEY_MAP.get(step_name)
     if key and key in ctx.extra:
         val = ctx.extra[key]
         if isinstance(val, dict) and "outputs" in val:
@@ -210,6 +335,13 @@ def _capture_outputs(step_name: str, ctx, step_trace: StepTrace) -> None:
             step_trace.outputs = [str(val)]
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes (orjson if available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def _write_cache_manifest(
     run_id: str,
     audio_file: Path,
@@ -224,121 +356,163 @@ def _write_cache_manifest(
     """
     cache_dir = output_root / "runs" / run_id / audio_file.stem / ".cache"
     cache_dir.mkdir(parents=True, exist_ok=True)
-    manifest_path = cache_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as fh:
-        json.dump(step_fingerprints, fh, indent=2)
+    (cache_dir / "manifest.json").write_bytes(_dumps(step_fingerprints))
 
 
-def _report_to_dict(report: RunReport) -> dict:
+def _file_trace_to_dict(f: FileTrace) -> dict:
     return {
-        "run_id": report.run_id,
-        "pipeline_name": report.pipeline_name,
-        "config_path": report.config_path,
-        "started_at": report.started_at,
-        "finished_at": report.finished_at,
-        "total_elapsed_sec": report.total_elapsed_sec,
-        "files": [
+        "input": f.input,
+        "status": f.status,
+        "error": f.error,
+        "steps": [
             {
-                "input": f.input,
-                "status": f.status,
-                "error": f.error,
-                "steps": [
-                    {
-                        "name": s.name,
-                        "status": s.status,
-                        "elapsed_sec": s.elapsed_sec,
-                        "outputs": s.outputs,
-                        "error": s.error,
-                    }
-                    for s in f.steps
-                ],
+                "name": s.name,
+                "status": s.status,
+                "elapsed_sec": s.elapsed_sec,
+                "outputs": s.outputs,
+                "error": s.error,
             }
-            for f in report.files
+            for s in f.steps
         ],
     }
 
 
-def _write_report(report: RunReport, output_root: Path) -> Path:
-    runs_dir = output_root / "_runs"
-    runs_dir.mkdir(parents=True, exist_ok=True)
-    report_path = runs_dir / f"run_{report.run_id}.json"
-    with open(report_path, "w", encoding="utf-8") as fh:
-        json.dump(_report_to_dict(report), fh, indent=2)
-    return report_path
+class _ReportWriter:
+    """Stream ``_runs/run_<run_id>.json`` one :class:`FileTrace` at a time.
 
+    The run header is written on construction, each file's trace is encoded
+    and written as soon as that file finishes, and :meth:`close` appends
+    ``finished_at`` / ``total_elapsed_sec`` / ``status`` / ``error`` and closes
+    the object.  Finished traces are therefore not kept in memory for the
+    whole run; callers must :meth:`close` even when the run is aborted so the
+    file stays valid JSON.
+    """
 
-# ── Main entry point ───────────────────────────────────────────────────────
+    def __init__(self, report: RunReport, output_root: Path) -> None:
+        runs_dir = output_root / "_runs"
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        self.path = runs_dir / f"run_{report.run_id}.json"
+        self.total = 0
+        self.succeeded = 0
+        self._fh = open(self.path, "wb")
+        header = {
+            "run_id": report.run_id,
+            "pipeline_name": report.pipeline_name,
+            "config_path": report.config_path,
+            "started_at": report.started_at,
+        }
+        self._fh.write(b"{\n")
+        for key, value in header.items():
+            self._fh.write(b'  "%s": %s,\n' % (key.encode(), _dumps(value)))
+        self._fh.write(b'  "files": [')
+
+    def add(self, file_trace: FileTrace) -> None:
+        self._fh.write(b",\n    " if self.total else b"\n    ")
+        # JSON strings cannot contain raw newlines, so this only re-indents
+        encoded = _dumps(_file_trace_to_dict(file_trace))
+        self._fh.write(encoded.replace(b"\n", b"\n    "))
+        self.total += 1
+        if file_trace.status == "success":
+            self.succeeded += 1
+
+    def close(self, report: RunReport) -> Path:
+        self._fh.write(b"\n  ],\n" if self.total else b"],\n")
+        self._fh.write(b'  "finished_at": %s,\n' % _dumps(report.finished_at))
+        self._fh.write(
+            b'  "total_elapsed_sec": %s,\n' % _dumps(report.total_elapsed_sec)
+        )
+        self._fh.write(b'  "status": %s,\n' % _dumps(report.status))
+        self._fh.write(b'  "error": %s\n}\n' % _dumps(report.error))
+        self._fh.close()
+        return self.path
 
-def run_pipeline(config_path: Path) -> None:
-    """Load *config_path* and execute the configured pipeline."""
-    from hydral.pipeline import PipelineContext
 
-    config = load_config(config_path)
-    input_root = Path(config.input)
-    output_root = Path(config.output)
+class _EmitHandler(logging.Handler):
+    """Forward log records to an ``emit(line)`` callable."""
 
-    run_id = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    started_at = datetime.datetime.now().isoformat()
+    def __init__(self, emit: Callable[[str], None]) -> None:
+        super().__init__()
+        self._emit_line = emit
 
-    print(f"\n🎵 Hydral Pipeline: {config.name!r}")
-    print(f"   Config : {config_path}")
-    print(f"   Input  : {input_root}")
-    print(f"   Output : {output_root}")
-    print(f"   Run ID : {run_id}")
+    def emit(self, record: logging.LogRecord) -> None:
+        self._emit_line(record.getMessage())
 
-    input_files = collect_inputs(input_root, config.glob)
-    if not input_files:
-        print(f"\n⚠  No audio files found under {input_root}")
-        return
 
-    print(f"\n📂 Found {len(input_files)} file(s):")
-    for f in input_files:
-        print(f"   {f}")
+@contextmanager
+def _step_logs_to(emit: Callable[[str], None]) -> Iterator[None]:
+    """Send ``hydral.steps`` records (the "✓ saved" lines) through *emit*.
 
-    report = RunReport(
-        run_id=run_id,
-        pipeline_name=config.name,
-        config_path=str(config_path),
-        started_at=started_at,
-    )
+    The records stop propagating to the root logger meanwhile, so they show up
+    once, in order with the runner's own lines and inside the per-file block
+    buffered by ``--jobs`` workers.  INFO is enabled unless the application
+    set an explicit level on ``hydral.steps``.
+    """
+    step_logger = logging.getLogger("hydral.steps")
+    handler = _EmitHandler(emit)
+    saved_level, saved_propagate = step_logger.level, step_logger.propagate
+    if saved_level == logging.NOTSET:
+        step_logger.setLevel(logging.INFO)
+    step_logger.propagate = False
+    step_logger.addHandler(handler)
+    try:
+        yield
+    finally:
+        step_logger.removeHandler(handler)
+        step_logger.setLevel(saved_level)
+        step_logger.propagate = saved_propagate
 
-    run_start = time.monotonic()
 
-    for audio_file in input_files:
-        print(f"\n▶  {audio_file.name}")
+# ── Main entry point ───────────────────────────────────────────────────────
+
+def _run_file(
+    audio_file: Path,
+    step_cfgs: List[StepConfig],
+    steps: List[Any],
+    output_root: Path,
+    run_id: str,
+    emit: Callable[[str], None] = print,
+) -> FileTrace:
+    """Run every configured step over *audio_file* and return its trace.
+
+    *steps* is the output of :func:`_build_steps` for *step_cfgs*.  Console
+    lines, including the steps' own ``hydral.steps`` log records, go through
+    *emit* so worker processes can buffer them.
+    """
+    from hydral.pipeline import PipelineContext
 
-        output_dir = output_root / audio_file.stem
-        ctx = PipelineContext(input_path=audio_file, output_dir=output_dir)
+    emit(f"\n▶  {audio_file.name}")
 
-        file_trace = FileTrace(input=str(audio_file), status="success")
-        file_failed = False
-        step_fingerprints: Dict[str, Any] = {}
+    output_dir = output_root / audio_file.stem
+    ctx = PipelineContext(input_path=audio_file, output_dir=output_dir)
 
-        for step_cfg in config.steps:
-            if not step_cfg.enabled:
-                print(f"   ⏭  {step_cfg.name} (disabled)")
+    file_trace = FileTrace(input=str(audio_file), status="success")
+    file_failed = False
+    step_fingerprints: Dict[str, Any] = {}
+
+    with _step_logs_to(emit):
+        for step_cfg, planned in zip(step_cfgs, steps):
+            if planned is None:
+                emit(f"   ⏭  {step_cfg.name} (disabled)")
                 file_trace.steps.append(
                     StepTrace(name=step_cfg.name, status="skipped_disabled")
                 )
                 continue
 
-            try:
-                step = build_step(step_cfg)
-            except ValueError as exc:
-                print(f"   ✗  {step_cfg.name}: {exc}")
+            if isinstance(planned, ValueError):
+                emit(f"   ✗  {step_cfg.name}: {planned}")
                 file_trace.steps.append(
-                    StepTrace(name=step_cfg.name, status="failed", error=str(exc))
+                    StepTrace(name=step_cfg.name, status="failed", error=str(planned))
                 )
                 file_failed = True
                 continue
 
             # Collect fingerprint before potentially mutating ctx.audio_path
-            if hasattr(step, "fingerprint"):
-                step_fingerprints[step_cfg.name] = step.fingerprint(ctx)
+            if planned.fingerprint is not None:
+                step_fingerprints[step_cfg.name] = planned.fingerprint(ctx)
 
             # Skip if the step's output already exists
-            if hasattr(step, "output_exists") and step.output_exists(ctx):
-                print(f"   ⏭  {step_cfg.name} (output exists)")
+            if planned.output_exists is not None and planned.output_exists(ctx):
+                emit(f"   ⏭  {step_cfg.name} (output exists)")
                 file_trace.steps.append(
                     StepTrace(name=step_cfg.name, status="skipped_exists")
                 )
@@ -346,7 +520,7 @@ def run_pipeline(config_path: Path) -> None:
 
             t0 = time.monotonic()
             try:
-                ctx = step.run(ctx)
+                ctx = planned.step.run(ctx)
                 elapsed = time.monotonic() - t0
                 step_trace = StepTrace(
                     name=step_cfg.name,
@@ -354,11 +528,11 @@ def run_pipeline(config_path: Path) -> None:
                     elapsed_sec=round(elapsed, 3),
                 )
                 _capture_outputs(step_cfg.name, ctx, step_trace)
-                print(f"      ({elapsed:.2f}s)")
+                emit(f"      ({elapsed:.2f}s)")
                 file_trace.steps.append(step_trace)
             except Exception as exc:  # noqa: BLE001
                 elapsed = time.monotonic() - t0
-                print(f"   ✗  {step_cfg.name} failed: {exc}")
+                emit(f"   ✗  {step_cfg.name} failed: {exc}")
                 file_trace.steps.append(
                     StepTrace(
                         name=step_cfg.name,
@@ -369,27 +543,121 @@ def run_pipeline(config_path: Path) -> None:
                 )
                 file_failed = True
 
-        # Write run-isolated fingerprint cache for this file
-        if step_fingerprints:
-            _write_cache_manifest(run_id, audio_file, output_root, step_fingerprints)
+    # Write run-isolated fingerprint cache for this file
+    if step_fingerprints:
+        _write_cache_manifest(run_id, audio_file, output_root, step_fingerprints)
+
+    if file_failed:
+        file_trace.status = "failed"
+        emit(f"   ✗ {audio_file.name}: FAILED")
+    else:
+        emit(f"   ✓ {audio_file.name}: OK")
+
+    return file_trace
+
+
+def _run_file_buffered(
+    audio_file: Path,
+    step_cfgs: List[StepConfig],
+    steps: List[Any],
+    output_root: Path,
+    run_id: str,
+) -> Tuple[FileTrace, List[str]]:
+    """Process-pool entry point: :func:`_run_file` with console lines collected."""
+    lines: List[str] = []
+    file_trace = _run_file(
+        audio_file, step_cfgs, steps, output_root, run_id, emit=lines.append
+    )
+    return file_trace, lines
+
+
+def run_pipeline(config_path: Path, jobs: int = 1) -> None:
+    """Load *config_path* and execute the configured pipeline."""
+    run_pipeline_from_config(load_config(config_path), config_path, jobs=jobs)
 
-        if file_failed:
-            file_trace.status = "failed"
-            print(f"   ✗ {audio_file.name}: FAILED")
-        else:
-            print(f"   ✓ {audio_file.name}: OK")
 
-        report.files.append(file_trace)
+def run_pipeline_from_config(
+    config: PipelineConfig, config_path: Optional[Path] = None, jobs: int = 1
+) -> None:
+    """Execute an already-built :class:`PipelineConfig`.
+
+    *config_path* is only recorded in the console header and the run report;
+    pass ``None`` for configs constructed in memory.  With ``jobs > 1`` the
+    input files are processed in a :class:`~concurrent.futures.ProcessPoolExecutor`
+    (steps must then be picklable).
+    """
+    config_label = str(config_path) if config_path is not None else "<in-memory>"
+    input_root = Path(config.input)
+    output_root = Path(config.output)
+
+    # One clock read so run_id and started_at describe the same instant
+    now = datetime.datetime.now()
+    run_id = now.strftime("%Y%m%d_%H%M%S")
+    started_at = now.isoformat()
 
-    total_elapsed = time.monotonic() - run_start
-    report.total_elapsed_sec = round(total_elapsed, 3)
-    report.finished_at = datetime.datetime.now().isoformat()
+    print(f"\n🎵 Hydral Pipeline: {config.name!r}")
+    print(f"   Config : {config_label}")
+    print(f"   Input  : {input_root}")
+    print(f"   Output : {output_root}")
+    print(f"   Run ID : {run_id}")
+
+    input_files = collect_inputs(input_root, config.glob)
+    if not input_files:
+        print(f"\n⚠  No audio files found under {input_root}")
+        return
 
-    report_path = _write_report(report, output_root)
-    print(f"\n📄 Report: {report_path}")
+    print(f"\n📂 Found {len(input_files)} file(s):")
+    for f in input_files:
+        print(f"   {f}")
+
+    report = RunReport(
+        run_id=run_id,
+        pipeline_name=config.name,
+        config_path=config_label,
+        started_at=started_at,
+    )
+
+    steps = _build_steps(config.steps)
+    writer = _ReportWriter(report, output_root)
+    run_start = time.monotonic()
+
+    try:
+        if jobs > 1 and len(input_files) > 1:
+            # Files are independent (own ctx, own output subdir). executor.map
+            # yields in input order, so the report and console stay deterministic;
+            # each file's lines are printed as one block when it finishes.
+            max_workers = min(jobs, len(input_files))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for file_trace, lines in executor.map(
+                    _run_file_buffered,
+                    input_files,
+                    repeat(config.steps),
+                    repeat(steps),
+                    repeat(output_root),
+                    repeat(run_id),
+                ):
+                    print("\n".join(lines))
+                    writer.add(file_trace)
+        else:
+            for audio_file in input_files:
+                writer.add(
+                    _run_file(audio_file, config.steps, steps, output_root, run_id)
+                )
+    except BaseException as exc:
+        # Still close the report below so a crash or Ctrl-C leaves valid JSON
+        report.status = "aborted"
+        report.error = f"{type(exc).__name__}: {exc}"
+        raise
+    else:
+        report.status = "completed"
+    finally:
+        total_elapsed = time.monotonic() - run_start
+        report.total_elapsed_sec = round(total_elapsed, 3)
+        report.finished_at = datetime.datetime.now().isoformat()
+        report_path = writer.close(report)
+        print(f"\n📄 Report: {report_path}")
 
-    success_count = sum(1 for f in report.files if f.status == "success")
     print(
-        f"✅ Done: {success_count}/{len(report.files)} files succeeded"
+        f"✅ Done: {writer.succeeded}/{writer.total} files succeeded"
         f" in {total_elapsed:.2f}s"
     )
@@ -0,0 +1,16 @@
+"""
+Helpers shared by the songmaking test modules (not collected by pytest).
+"""
+import json
+from pathlib import Path
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+def read_json(path) -> dict:
+    """Parse the JSON file at path in one read (orjson when available)."""
+    return _loads(Path(path).read_bytes())
@@ -17,11 +17,11 @@ from songmaking.generators.markov import generate_markov_melody
 from songmaking.export_midi import create_melody_midi, save_midi_file
 from songmaking.eval import aggregate_melody_score
 from songmaking.pitch_stats import (
-    check_pitch_constraint,
     get_pitch_stats,
     compute_pitch_stats,
     extract_melody_pitches_from_midi,
-    calculate_mean_interval
+    calculate_mean_interval,
+    make_mean_pitch_checker
 )
 
 # Configure logging
@@ -224,6 +224,14 @@ def generate_and_save(
     debug_stats = None
     enhanced_pitch_stats = None
 
+    # generate_melody_midi already returns each attempt's mean pitch, so only
+    # the bounds check runs per attempt (bounds fixed once, no re-scan)
+    if args.mean_pitch_target is not None:
+        mean_in_range = make_mean_pitch_checker(
+            args.mean_pitch_target,
+            args.mean_pitch_tolerance
+        )
+
     while attempt < args.max_attempts:
         attempt += 1
 
@@ -239,11 +247,7 @@ def generate_and_save(
 
         if args.mean_pitch_target is None:
             break
-        elif pitch_stats["mean"] is not None and check_pitch_constraint(
-            pitches,
-            args.mean_pitch_target,
-            args.mean_pitch_tolerance
-        ):
+        elif mean_in_range(pitch_stats["mean"]):
             print(f"Constraint satisfied on attempt {attempt}")
             print(f"  Generated mean pitch: {pitch_stats['mean']:.2f}")
             break
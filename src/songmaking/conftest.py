@@ -0,0 +1,11 @@
+"""pytest configuration shared by the songmaking test modules.
+
+Puts ``src/`` on ``sys.path`` once per session so the tests can
+``from songmaking import ...`` without a per-file path hack.
+"""
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
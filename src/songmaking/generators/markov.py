@@ -5,17 +5,18 @@ Quantizes all output to scale notes.
 """
 import random
 from typing import List, Tuple, Dict, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
 from songmaking.harmony import HarmonySpec
 from songmaking.structure import MelodyStructureSpec
 from songmaking.structure_utils import (
     apply_motif_repetition,
     calculate_repeat_count,
-    compute_duration_distribution
+    compute_duration_distribution,
+    format_duration_counts
 )
 from songmaking.note_utils import (
     get_discrete_duration_values,
-    snap_to_grid,
+    GRID_RESOLUTION,
     choose_duration,
     build_scale_pitch_set,
     pick_scale_pitch,
@@ -178,6 +179,8 @@ def generate_markov_melody(
     )
     if not scale_notes:
         scale_notes = list(range(spec.lowest_midi, spec.highest_midi + 1))
+    # O(1) membership for the per-note scale check below
+    scale_set = frozenset(scale_notes)
     
     # Octave-up jump chance
     octave_up_chance = config.get("octave_up_chance", 0.03)
@@ -192,8 +195,16 @@ def generate_markov_melody(
         pitches.append(pitch)
     
     # Generate until we fill duration
+    # Position is kept as an integer count of grid steps. GRID_RESOLUTION is
+    # a power of two, so round(steps + dur / GRID_RESOLUTION) lands on exactly
+    # the same grid point as snap_to_grid(elapsed_beats + dur) did.
+    elapsed_steps = 0
     elapsed_beats = 0.0
+    # Plain running sum of durations (same order as sum(durations)), kept
+    # separately because elapsed_beats is grid-snapped
+    durations_total = 0.0
     
+    duration_counts = Counter()
     note_idx = 0
     while elapsed_beats < total_beats:
         # Add duration for current note
@@ -212,12 +223,12 @@ def generate_markov_melody(
             dur = choose_duration(remaining, allowed_durations, rng)
         
         # Track duration
-        dur_key = f"{dur:.3f}"
-        debug_stats["duration_distribution"][dur_key] = \
-            debug_stats["duration_distribution"].get(dur_key, 0) + 1
+        duration_counts[dur] += 1
         
         durations.append(dur)
-        elapsed_beats = snap_to_grid(elapsed_beats + dur)
+        durations_total += dur
+        elapsed_steps = round(elapsed_steps + dur / GRID_RESOLUTION)
+        elapsed_beats = elapsed_steps * GRID_RESOLUTION
         
         # Predict next pitch if we need more
         if elapsed_beats < total_beats:
@@ -225,7 +236,7 @@ def generate_markov_melody(
             next_pitch = model.predict_next(context, rng)
             
             # Quantize to nearest scale note
-            if next_pitch not in scale_notes:
+            if next_pitch not in scale_set:
                 next_pitch = _quantize_to_nearest_scale_note(next_pitch, scale_notes)
                 # Track scale corrections (parallel to scored's rejection of entire candidates)
                 debug_stats["scale_out_rejections"] += 1
@@ -243,6 +254,8 @@ def generate_markov_melody(
         
         note_idx += 1
     
+    debug_stats["duration_distribution"] = format_duration_counts(duration_counts)
+    
     # Ensure lists are same length
     pitches = pitches[:len(durations)]
     
@@ -254,14 +267,18 @@ def generate_markov_melody(
             structure_spec.repeat_unit_beats,
             structure_spec.allow_motif_variation,
             structure_spec.variation_probability,
-            rng
-        )
-        debug_stats["repeat_count"] = calculate_repeat_count(
-            pitches, durations, structure_spec.repeat_unit_beats
+            rng,
+            total_beats=durations_total
         )
     
     # Record final stats
-    debug_stats["total_beats"] = sum(durations)
+    final_beats = sum(durations)
+    if structure_spec and structure_spec.repeat_unit_beats:
+        debug_stats["repeat_count"] = calculate_repeat_count(
+            pitches, durations, structure_spec.repeat_unit_beats,
+            total_beats=final_beats
+        )
+    debug_stats["total_beats"] = final_beats
     debug_stats["actual_duration_distribution"] = compute_duration_distribution(durations)
     
     return pitches, durations, debug_stats
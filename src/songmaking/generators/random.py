@@ -3,18 +3,21 @@ Random melody generator with harmonic constraints.
 Produces melodies using constrained randomness within HarmonySpec bounds.
 """
 import random
-from typing import List, Tuple, Dict, Optional
+from collections import Counter
+from itertools import accumulate
+from typing import List, Tuple, Dict, Optional, Sequence
 from songmaking.harmony import HarmonySpec
 from songmaking.structure import MelodyStructureSpec
 from songmaking.structure_utils import (
     apply_motif_repetition,
     enforce_rhythm_profile,
     calculate_repeat_count,
-    compute_duration_distribution
+    compute_duration_distribution,
+    format_duration_counts
 )
 from songmaking.note_utils import (
     get_discrete_duration_values,
-    snap_to_grid,
+    GRID_RESOLUTION,
     choose_duration,
     build_scale_pitch_set,
     pick_scale_pitch,
@@ -26,7 +29,8 @@ def generate_random_melody(
     spec: HarmonySpec,
     rng_seed: int,
     config: dict,
-    structure_spec: Optional[MelodyStructureSpec] = None
+    structure_spec: Optional[MelodyStructureSpec] = None,
+    scale_pitches: Optional[Sequence[int]] = None
 ) -> Tuple[List[int], List[float], Dict]:
     """
     Create melody using random selection within harmonic constraints.
@@ -36,6 +40,7 @@ def generate_random_melody(
         rng_seed: Seed for reproducibility
         config: Additional parameters (note_density, rest_probability, etc.)
         structure_spec: Optional structural constraints (repetition, rhythm profile)
+        scale_pitches: Prebuilt scale pitch set for *spec* (built here if None)
     
     Returns:
         (midi_pitches, durations_in_beats, debug_stats) as tuple
@@ -52,13 +57,14 @@ def generate_random_melody(
         "actual_duration_distribution": {}
     }
     
-    # Build scale pitch set
-    scale_pitches = build_scale_pitch_set(
-        spec.tonic_note,
-        spec.scale_pattern,
-        spec.lowest_midi,
-        spec.highest_midi
-    )
+    # Build scale pitch set (callers generating many candidates pass it in)
+    if scale_pitches is None:
+        scale_pitches = build_scale_pitch_set(
+            spec.tonic_note,
+            spec.scale_pattern,
+            spec.lowest_midi,
+            spec.highest_midi
+        )
     
     if not scale_pitches:
         # Fallback if constraints too tight
@@ -72,8 +78,13 @@ def generate_random_melody(
     allowed_durations = get_discrete_duration_values(beats_per_bar)
     
     # Apply rhythm profile if specified
-    if structure_spec and structure_spec.rhythm_profile:
-        allowed_durations = list(structure_spec.rhythm_profile.keys())
+    rhythm_profile = structure_spec.rhythm_profile if structure_spec else None
+    if rhythm_profile:
+        allowed_durations = list(rhythm_profile.keys())
+        # Loop-invariant: precompute once instead of rebuilding the key/weight
+        # lists per note. choices(cum_weights=...) draws exactly as weights=...
+        profile_durations = allowed_durations
+        profile_cum_weights = list(accumulate(rhythm_profile.values()))
     
     # Octave-up jump chance (1-5%)
     octave_up_chance = config.get("octave_up_chance", 0.03)
@@ -81,19 +92,29 @@ def generate_random_melody(
     # Generate note sequence
     pitches = []
     durations = []
+    # Position is kept as an integer count of grid steps. GRID_RESOLUTION is
+    # a power of two, so round(steps + dur / GRID_RESOLUTION) lands on exactly
+    # the same grid point as snap_to_grid(elapsed_beats + dur) did.
+    elapsed_steps = 0
     elapsed_beats = 0.0
+    # Plain running sum of durations (same order as sum(durations)), kept
+    # separately because elapsed_beats is grid-snapped
+    durations_total = 0.0
     
     rest_chance = config.get("rest_probability", 0.15)
+    # Count raw durations in the loop; the "0.250"-style keys are built once
+    # after generation instead of formatting a string for every note.
+    duration_counts = Counter()
     
     while elapsed_beats < total_beats:
         remaining = total_beats - elapsed_beats
         
         # Choose discrete duration
-        if structure_spec and structure_spec.rhythm_profile:
+        if rhythm_profile:
             # Weight choice by rhythm profile
             dur = rng.choices(
-                list(structure_spec.rhythm_profile.keys()),
-                weights=list(structure_spec.rhythm_profile.values())
+                profile_durations,
+                cum_weights=profile_cum_weights
             )[0]
             # Ensure it fits
             if dur > remaining + 0.001:
@@ -102,9 +123,7 @@ def generate_random_melody(
             dur = choose_duration(remaining, allowed_durations, rng)
         
         # Track duration usage
-        dur_key = f"{dur:.3f}"
-        debug_stats["duration_distribution"][dur_key] = \
-            debug_stats["duration_distribution"].get(dur_key, 0) + 1
+        duration_counts[dur] += 1
         
         # Decide rest or note
         if rng.random() < rest_chance:
@@ -138,7 +157,11 @@ def generate_random_melody(
             pitches.append(pitch)
         
         durations.append(dur)
-        elapsed_beats = snap_to_grid(elapsed_beats + dur)
+        durations_total += dur
+        elapsed_steps = round(elapsed_steps + dur / GRID_RESOLUTION)
+        elapsed_beats = elapsed_steps * GRID_RESOLUTION
+    
+    debug_stats["duration_distribution"] = format_duration_counts(duration_counts)
     
     # Apply structural constraints if specified
     if structure_spec and structure_spec.repeat_unit_beats:
@@ -148,14 +171,18 @@ def generate_random_melody(
             structure_spec.repeat_unit_beats,
             structure_spec.allow_motif_variation,
             structure_spec.variation_probability,
-            rng
-        )
-        debug_stats["repeat_count"] = calculate_repeat_count(
-            pitches, durations, structure_spec.repeat_unit_beats
+            rng,
+            total_beats=durations_total
         )
     
     # Record final stats
-    debug_stats["total_beats"] = sum(durations)
+    final_beats = sum(durations)
+    if structure_spec and structure_spec.repeat_unit_beats:
+        debug_stats["repeat_count"] = calculate_repeat_count(
+            pitches, durations, structure_spec.repeat_unit_beats,
+            total_beats=final_beats
+        )
+    debug_stats["total_beats"] = final_beats
     debug_stats["actual_duration_distribution"] = compute_duration_distribution(durations)
     
     return pitches, durations, debug_stats
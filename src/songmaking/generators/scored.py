@@ -10,7 +10,6 @@ from songmaking.generators.random import generate_random_melody
 from songmaking.eval import aggregate_melody_score
 from songmaking.note_utils import (
     get_discrete_duration_values,
-    is_pitch_in_scale,
     build_scale_pitch_set
 )
 
@@ -45,6 +44,9 @@ def generate_scored_melody(
         spec.highest_midi
     )
     
+    # O(1) membership for the per-candidate out-of-scale check
+    scale_set = frozenset(scale_pitches)
+    
     # Get valid durations
     beats_per_bar = spec.meter_numerator * (4.0 / spec.meter_denominator)
     valid_durations = set(get_discrete_duration_values(beats_per_bar))
@@ -53,6 +55,10 @@ def generate_scored_melody(
     if structure_spec and structure_spec.rhythm_profile:
         valid_durations.update(structure_spec.rhythm_profile.keys())
     
+    # Grid values rounded once: exact-grid durations (the normal case) are
+    # accepted with one hash lookup; only misses fall back to the tolerance scan.
+    valid_rounded = frozenset(round(vd, 3) for vd in valid_durations)
+    
     candidates = []
     combined_debug_stats = {
         "duration_distribution": {},
@@ -68,23 +74,19 @@ def generate_scored_melody(
         trial_seed = rng_seed + attempt * 1000
         
         pitches, durations, debug_stats = generate_random_melody(
-            spec, trial_seed, config, structure_spec
+            spec, trial_seed, config, structure_spec, scale_pitches=scale_pitches
         )
         
         # Validation: check for out-of-scale notes
-        scale_violation = False
-        for pitch in pitches:
-            if pitch > 0 and not is_pitch_in_scale(pitch, scale_pitches):
-                scale_violation = True
-                combined_debug_stats["scale_out_rejections"] += 1
-                break
-        
-        if scale_violation:
+        if any(pitch > 0 and pitch not in scale_set for pitch in pitches):
+            combined_debug_stats["scale_out_rejections"] += 1
             continue
         
         # Validation: check for invalid durations
         invalid_duration = False
         for dur in durations:
+            if round(dur, 3) in valid_rounded:
+                continue
             # Allow small floating point tolerance
             if not any(abs(dur - vd) < 0.001 for vd in valid_durations):
                 invalid_duration = True
@@ -2,6 +2,7 @@
 Utilities for note duration, timing, and scale constraint handling.
 Provides discrete note values, grid snapping, and scale-aware pitch selection.
 """
+import functools
 import random
 from typing import List, Tuple, Optional
 
@@ -105,6 +106,19 @@ def build_scale_pitch_set(
     Returns:
         Sorted list of MIDI pitches in scale within range
     """
+    # Fresh list per call so callers may mutate it; the build itself is cached.
+    return list(_scale_pitch_tuple(
+        tonic_note, tuple(scale_pattern), lowest_midi, highest_midi
+    ))
+
+
+@functools.lru_cache(maxsize=64)
+def _scale_pitch_tuple(
+    tonic_note: str,
+    scale_pattern: Tuple[int, ...],
+    lowest_midi: int,
+    highest_midi: int
+) -> Tuple[int, ...]:
     base_midi = _note_name_to_midi(tonic_note, 4)  # C4 = 60
     
     allowed_pitches = []
@@ -115,7 +129,7 @@ def build_scale_pitch_set(
             if lowest_midi <= candidate <= highest_midi:
                 allowed_pitches.append(candidate)
     
-    return sorted(set(allowed_pitches))
+    return tuple(sorted(set(allowed_pitches)))
 
 
 def pick_scale_pitch(
@@ -157,17 +171,21 @@ def pick_scale_pitch(
                 octave_jump = True
                 return candidate, octave_jump
     
-    # Normal selection - prefer stepwise motion if we have previous pitch
-    if previous_pitch is not None and previous_pitch in scale_pitches:
-        # Find nearby scale notes
-        prev_idx = scale_pitches.index(previous_pitch)
-        
-        # Collect neighbors within a few scale steps
-        neighbors = []
-        for offset in [-2, -1, 1, 2]:
-            idx = prev_idx + offset
-            if 0 <= idx < len(scale_pitches):
-                neighbors.append(scale_pitches[idx])
+    # Normal selection - prefer stepwise motion if we have previous pitch.
+    # A single index() scan doubles as the membership test.
+    prev_idx = None
+    if previous_pitch is not None:
+        try:
+            prev_idx = scale_pitches.index(previous_pitch)
+        except ValueError:
+            pass
+    
+    if prev_idx is not None:
+        # Collect neighbors within two scale steps (below, then above)
+        neighbors = (
+            scale_pitches[max(0, prev_idx - 2):prev_idx]
+            + scale_pitches[prev_idx + 1:prev_idx + 3]
+        )
         
         # Prefer neighbors with 60% probability
         if neighbors and rng.random() < 0.6:
@@ -2,9 +2,10 @@
 Pitch statistics utilities for analyzing and constraining melodies.
 Calculates mean pitch and checks against target/tolerance constraints.
 """
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import io
 import math
+import operator
 
 import mido
 
@@ -19,12 +20,19 @@ def calculate_mean_pitch(midi_notes: List[int]) -> Optional[float]:
     Returns:
         Mean pitch as float, or None if no sounding notes
     """
-    sounding_notes = [p for p in midi_notes if p > 0]
+    # One pass, no intermediate list: this sits inside check_pitch_constraint,
+    # which candidate-search loops call once per generated melody.
+    total = 0
+    count = 0
+    for p in midi_notes:
+        if p > 0:
+            total += p
+            count += 1
     
-    if not sounding_notes:
+    if count == 0:
         return None
     
-    return sum(sounding_notes) / len(sounding_notes)
+    return total / count
 
 
 def extract_melody_pitches_from_midi(midi_bytes: bytes) -> List[int]:
@@ -35,17 +43,24 @@ def extract_melody_pitches_from_midi(midi_bytes: bytes) -> List[int]:
     If multiple note_on events share the same tick, keep only the highest pitch.
     """
     mid = mido.MidiFile(file=io.BytesIO(midi_bytes))
-    pitches_by_tick: Dict[int, int] = {}
+    pitches: List[int] = []
     absolute_tick = 0
+    current_tick = -1
     
+    # merge_tracks yields events in time order, so ticks never decrease and
+    # same-tick note_ons are adjacent: collapse them to the highest pitch
+    # on the fly instead of keying a dict by tick and sorting it afterwards.
     for msg in mido.merge_tracks(mid.tracks):
         absolute_tick += msg.time
         if msg.type == "note_on" and msg.velocity > 0:
-            existing = pitches_by_tick.get(absolute_tick)
-            if existing is None or msg.note > existing:
-                pitches_by_tick[absolute_tick] = msg.note
+            if absolute_tick == current_tick:
+                if msg.note > pitches[-1]:
+                    pitches[-1] = msg.note
+            else:
+                pitches.append(msg.note)
+                current_tick = absolute_tick
     
-    return [pitches_by_tick[tick] for tick in sorted(pitches_by_tick)]
+    return pitches
 
 
 def calculate_mean_interval(pitches: List[int]) -> float:
@@ -56,8 +71,9 @@ def calculate_mean_interval(pitches: List[int]) -> float:
     if len(pitches) < 2:
         return 0.0
     
-    intervals = [abs(pitches[i] - pitches[i - 1]) for i in range(1, len(pitches))]
-    return sum(intervals) / len(intervals)
+    # Adjacent differences via C-level map/zip instead of an indexed listcomp
+    total = sum(map(abs, map(operator.sub, pitches[1:], pitches)))
+    return total / (len(pitches) - 1)
 
 
 def check_pitch_constraint(
@@ -76,15 +92,91 @@ def check_pitch_constraint(
     Returns:
         True if mean pitch is within tolerance, False otherwise
     """
+    return evaluate_melody(midi_notes, target_pitch, tolerance)[1]
+
+
+def evaluate_melody(
+    midi_notes: List[int],
+    target_pitch: float,
+    tolerance: float
+) -> Tuple[Optional[float], bool]:
+    """
+    Compute the mean pitch and check it against target ± tolerance.
+    
+    For callers that need both values: the mean is computed once instead of
+    once by calculate_mean_pitch and again inside check_pitch_constraint.
+    
+    Args:
+        midi_notes: List of MIDI pitch values
+        target_pitch: Target mean pitch (MIDI value)
+        tolerance: Allowed deviation in semitones
+    
+    Returns:
+        (mean_pitch, within_tolerance); mean_pitch is None (and the check
+        False) if there are no sounding notes
+    """
     mean_pitch = calculate_mean_pitch(midi_notes)
     
     if mean_pitch is None:
-        return False
+        return None, False
+    
+    lower_bound = target_pitch - tolerance
+    upper_bound = target_pitch + tolerance
+    
+    return mean_pitch, lower_bound <= mean_pitch <= upper_bound
+
+
+def make_mean_pitch_checker(
+    target_pitch: float,
+    tolerance: float
+) -> Callable[[Optional[float]], bool]:
+    """
+    Build a bounds check for an already-computed mean pitch.
+    
+    For callers that get the mean from elsewhere (e.g. get_pitch_stats):
+    the bounds are computed once and the notes are not scanned again.
+    
+    Args:
+        target_pitch: Target mean pitch (MIDI value)
+        tolerance: Allowed deviation in semitones
     
+    Returns:
+        Function taking a mean pitch (None if there were no sounding notes)
+        and returning True if it is within tolerance
+    """
     lower_bound = target_pitch - tolerance
     upper_bound = target_pitch + tolerance
     
-    return lower_bound <= mean_pitch <= upper_bound
+    def check(mean_pitch: Optional[float]) -> bool:
+        return mean_pitch is not None and lower_bound <= mean_pitch <= upper_bound
+    
+    return check
+
+
+def make_pitch_checker(
+    target_pitch: float,
+    tolerance: float
+) -> Callable[[List[int]], bool]:
+    """
+    Build a check_pitch_constraint equivalent with the bounds fixed.
+    
+    Useful in regeneration loops where target and tolerance never change:
+    the bounds are computed once instead of on every attempt.
+    
+    Args:
+        target_pitch: Target mean pitch (MIDI value)
+        tolerance: Allowed deviation in semitones
+    
+    Returns:
+        Function taking MIDI pitch values and returning True if their mean
+        pitch is within tolerance
+    """
+    mean_in_range = make_mean_pitch_checker(target_pitch, tolerance)
+    
+    def check(midi_notes: List[int]) -> bool:
+        return mean_in_range(calculate_mean_pitch(midi_notes))
+    
+    return check
 
 
 def compute_pitch_stats(notes: List[int]) -> Dict[str, Any]:
@@ -103,9 +195,23 @@ def compute_pitch_stats(notes: List[int]) -> Dict[str, Any]:
         - pitch_range: Pitch range (max - min, None if no sounding notes)
         - pitch_std: Standard deviation of pitches (None if no sounding notes)
     """
-    sounding_notes = [p for p in notes if p > 0]
+    # Single pass: count, sum, sum of squares, min and max of sounding notes
+    count = 0
+    total = 0
+    total_sq = 0
+    min_pitch = None
+    max_pitch = None
+    for p in notes:
+        if p > 0:
+            count += 1
+            total += p
+            total_sq += p * p
+            if min_pitch is None or p < min_pitch:
+                min_pitch = p
+            if max_pitch is None or p > max_pitch:
+                max_pitch = p
     
-    if not sounding_notes:
+    if count == 0:
         return {
             "avg_pitch": None,
             "note_count": len(notes),
@@ -115,18 +221,10 @@ def compute_pitch_stats(notes: List[int]) -> Dict[str, Any]:
             "pitch_std": None
         }
     
-    # Calculate mean
-    mean_pitch = sum(sounding_notes) / len(sounding_notes)
-    
-    # Calculate standard deviation
-    if len(sounding_notes) > 1:
-        variance = sum((p - mean_pitch) ** 2 for p in sounding_notes) / len(sounding_notes)
-        std_dev = math.sqrt(variance)
-    else:
-        std_dev = 0.0
+    mean_pitch = total / count
     
-    min_pitch = min(sounding_notes)
-    max_pitch = max(sounding_notes)
+    # Population variance from integer sums: exact, no cancellation error
+    std_dev = math.sqrt((count * total_sq - total * total) / (count * count))
     
     return {
         "avg_pitch": mean_pitch,
@@ -164,10 +262,13 @@ def get_pitch_stats(midi_notes: List[int]) -> dict:
             "sounding_count": 0
         }
     
+    min_pitch = min(sounding_notes)
+    max_pitch = max(sounding_notes)
+    
     return {
         "mean": sum(sounding_notes) / len(sounding_notes),
-        "min": min(sounding_notes),
-        "max": max(sounding_notes),
-        "range": max(sounding_notes) - min(sounding_notes),
+        "min": min_pitch,
+        "max": max_pitch,
+        "range": max_pitch - min_pitch,
         "sounding_count": len(sounding_notes)
     }
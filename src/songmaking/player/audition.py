@@ -4,6 +4,7 @@ Generates fragments and attempts playback using pygame.midi if available.
 """
 import argparse
 import sys
+import time
 from pathlib import Path
 import pretty_midi
 
@@ -24,6 +25,38 @@ def check_pygame_midi():
         return False
 
 
+def _play_events(midi_out, events, stop_event) -> None:
+    """
+    Send time-ordered note events to a pygame.midi output.
+    
+    Waits are computed against the absolute start time on the monotonic
+    perf_counter, so sleep overshoot never accumulates and wall-clock
+    adjustments cannot stall or rush playback. Waiting on stop_event
+    instead of sleeping lets another thread cut playback short.
+    
+    Args:
+        midi_out: Open pygame.midi.Output
+        events: Iterable of (time_sec, 'note_on'|'note_off', pitch, velocity)
+        stop_event: threading.Event that aborts playback when set
+    """
+    start_time = time.perf_counter()
+    
+    for event_time, event_type, pitch, velocity in events:
+        # Wait until event time
+        wait_time = start_time + event_time - time.perf_counter()
+        if wait_time > 0 and stop_event.wait(wait_time):
+            break
+        
+        # Send MIDI event
+        if event_type == 'note_on':
+            midi_out.note_on(pitch, velocity)
+        elif event_type == 'note_off':
+            midi_out.note_off(pitch, velocity)
+    
+    # All Notes Off (CC 123) so an interrupted run leaves nothing hanging
+    midi_out.write_short(0xB0, 123, 0)
+
+
 def play_midi_file(midi_path: str):
     """
     Play a MIDI file using pygame.midi if available.
@@ -35,7 +68,9 @@ def play_midi_file(midi_path: str):
     try:
         import pygame
         import pygame.midi
-        import time
+        import heapq
+        import threading
+        from operator import attrgetter, itemgetter
         
         # Initialize pygame.midi
         pygame.midi.init()
@@ -50,42 +85,50 @@ def play_midi_file(midi_path: str):
         # Load and parse MIDI file
         pm = pretty_midi.PrettyMIDI(midi_path)
         
-        # Simple playback: send all notes with timing
-        all_events = []
+        # Simple playback: send all notes with timing. Each instrument
+        # yields one note-on and one note-off stream, each sorted by time
+        # (Timsort is linear on the usual already-ordered notes), and
+        # heapq.merge interleaves them lazily instead of sorting one big
+        # list. Off streams go first so that, at equal times, a note is
+        # released before the next note on the same pitch starts.
+        on_streams = []
+        off_streams = []
         
         for instrument in pm.instruments:
-            for note in instrument.notes:
-                # Note on event
-                all_events.append((note.start, 'note_on', note.pitch, note.velocity))
-                # Note off event
-                all_events.append((note.end, 'note_off', note.pitch, 0))
+            on_streams.append([
+                (note.start, 'note_on', note.pitch, note.velocity)
+                for note in sorted(instrument.notes, key=attrgetter('start'))
+            ])
+            off_streams.append([
+                (note.end, 'note_off', note.pitch, 0)
+                for note in sorted(instrument.notes, key=attrgetter('end'))
+            ])
         
-        # Sort events by time
-        all_events.sort(key=lambda x: x[0])
+        all_events = heapq.merge(*off_streams, *on_streams, key=itemgetter(0))
         
-        # Play events
-        start_time = time.time()
+        # Play events on a worker thread so the main thread stays free to
+        # take Ctrl+C; the worker stops at its next wait once stop is set.
+        stop = threading.Event()
+        player = threading.Thread(
+            target=_play_events, args=(midi_out, all_events, stop), daemon=True
+        )
+        player.start()
         
-        for event_time, event_type, pitch, velocity in all_events:
-            # Wait until event time
-            current_time = time.time() - start_time
-            wait_time = event_time - current_time
-            
-            if wait_time > 0:
-                time.sleep(wait_time)
-            
-            # Send MIDI event
-            if event_type == 'note_on':
-                midi_out.note_on(pitch, velocity)
-            elif event_type == 'note_off':
-                midi_out.note_off(pitch, velocity)
+        try:
+            # Join in short slices so KeyboardInterrupt is delivered promptly
+            while player.is_alive():
+                player.join(0.1)
+        except KeyboardInterrupt:
+            stop.set()
+            player.join()
+            print("\nPlayback stopped.")
+        else:
+            print("Playback complete.")
         
         # Clean up
         del midi_out
         pygame.midi.quit()
         
-        print("Playback complete.")
-        
     except Exception as e:
         print(f"Playback error: {e}")
         print("MIDI file saved but playback failed.")
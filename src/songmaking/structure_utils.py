@@ -3,6 +3,8 @@ Utilities for applying structural constraints to melody generation.
 Handles repetition, motif variation, and rhythm profile enforcement.
 """
 import random
+from collections import Counter
+from itertools import repeat
 from typing import List, Tuple, Dict, Optional
 
 
@@ -12,7 +14,8 @@ def apply_motif_repetition(
     repeat_unit_beats: float,
     allow_variation: bool = False,
     variation_probability: float = 0.3,
-    rng: random.Random = None
+    rng: random.Random = None,
+    total_beats: Optional[float] = None
 ) -> Tuple[List[int], List[float]]:
     """
     Apply repeating unit structure to pitch/duration sequence.
@@ -24,6 +27,8 @@ def apply_motif_repetition(
         allow_variation: Allow subtle variations in repetitions
         variation_probability: Probability of variation per repeat
         rng: Random number generator (default: create new one)
+        total_beats: Precomputed sum of durations, if the caller already
+            tracks it (default: summed here)
     
     Returns:
         (modified_pitches, modified_durations) with repetition applied
@@ -50,33 +55,33 @@ def apply_motif_repetition(
         return pitches, durations
     
     # Calculate how many full repetitions we need
-    total_beats = sum(durations)
+    if total_beats is None:
+        total_beats = sum(durations)
     num_repeats = int(total_beats / repeat_unit_beats)
     
     if num_repeats < 2:
         # Not enough material for repetition
         return pitches, durations
     
-    # Build repeated sequence
-    new_pitches = []
-    new_durations = []
+    # Rhythm is identical in every repeat: one C-level list repeat + trim
+    # to the original length instead of num_repeats extend() calls.
+    keep = len(durations)
+    new_durations = (unit_durations * num_repeats)[:keep]
+    
+    if not allow_variation:
+        new_pitches = (unit_pitches * num_repeats)[:keep]
+        return new_pitches, new_durations
     
-    for repeat_idx in range(num_repeats):
-        if repeat_idx == 0 or not allow_variation or rng.random() >= variation_probability:
+    # Variation draws from rng per repeat, so keep the per-repeat loop here
+    new_pitches = list(unit_pitches)
+    for _ in range(1, num_repeats):
+        if rng.random() >= variation_probability:
             # Use original motif
             new_pitches.extend(unit_pitches)
-            new_durations.extend(unit_durations)
         else:
-            # Apply subtle variation
-            varied_pitches = _apply_subtle_variation(unit_pitches, rng)
-            new_pitches.extend(varied_pitches)
-            new_durations.extend(unit_durations)  # Keep rhythm same
-    
-    # Trim to original length
-    trim_beats = sum(new_durations[:len(durations)])
-    if len(new_durations) > len(durations):
-        new_pitches = new_pitches[:len(durations)]
-        new_durations = new_durations[:len(durations)]
+            # Apply subtle variation (rhythm stays the same)
+            new_pitches.extend(_apply_subtle_variation(unit_pitches, rng))
+    del new_pitches[keep:]
     
     return new_pitches, new_durations
 
@@ -114,14 +119,11 @@ def _apply_subtle_variation(pitches: List[int], rng: random.Random) -> List[int]
         if len(pitches) < 2:
             return pitches
         
-        anchor = pitches[0]
-        inverted = [anchor]
-        for i in range(1, len(pitches)):
-            if pitches[i] > 0:
-                interval = pitches[i] - pitches[i-1]
-                inverted.append(max(0, inverted[-1] - interval))
-            else:
-                inverted.append(0)
+        current = pitches[0]
+        inverted = [current]
+        for prev, pitch in zip(pitches, pitches[1:]):
+            current = max(0, current - (pitch - prev)) if pitch > 0 else 0
+            inverted.append(current)
         return inverted
     
     return pitches
@@ -157,13 +159,13 @@ def enforce_rhythm_profile(
     diff = total_notes - sum(target_counts.values())
     if diff > 0:
         # Add extra notes to most common duration
-        max_dur = max(target_profile.keys(), key=lambda d: target_profile[d])
+        max_dur = max(target_profile, key=target_profile.get)
         target_counts[max_dur] += diff
     
-    # Build new duration list
+    # Build new duration list (repeat() avoids a temporary list per duration)
     new_durations = []
     for dur, count in target_counts.items():
-        new_durations.extend([dur] * count)
+        new_durations.extend(repeat(dur, count))
     
     # Shuffle to avoid patterns
     rng.shuffle(new_durations)
@@ -171,8 +173,9 @@ def enforce_rhythm_profile(
     # Ensure we have exact count
     if len(new_durations) < total_notes:
         # Pad with random choices from profile
+        profile_durations = list(target_profile)
         while len(new_durations) < total_notes:
-            new_durations.append(rng.choice(list(target_profile.keys())))
+            new_durations.append(rng.choice(profile_durations))
     elif len(new_durations) > total_notes:
         new_durations = new_durations[:total_notes]
     
@@ -182,7 +185,8 @@ def enforce_rhythm_profile(
 def calculate_repeat_count(
     pitches: List[int],
     durations: List[float],
-    unit_beats: float
+    unit_beats: float,
+    total_beats: Optional[float] = None
 ) -> int:
     """
     Count number of complete repeating units in sequence.
@@ -191,6 +195,7 @@ def calculate_repeat_count(
         pitches: MIDI pitch sequence
         durations: Duration sequence
         unit_beats: Expected unit length in beats
+        total_beats: Precomputed sum of durations (default: summed here)
     
     Returns:
         Number of complete units found
@@ -198,7 +203,8 @@ def calculate_repeat_count(
     if unit_beats <= 0 or not durations:
         return 0
     
-    total_beats = sum(durations)
+    if total_beats is None:
+        total_beats = sum(durations)
     return int(total_beats / unit_beats)
 
 
@@ -215,11 +221,26 @@ def compute_duration_distribution(durations: List[float]) -> Dict[float, float]:
     if not durations:
         return {}
     
-    counts = {}
-    for dur in durations:
-        # Round to 3 decimals to avoid floating point issues
-        rounded_dur = round(dur, 3)
-        counts[rounded_dur] = counts.get(rounded_dur, 0) + 1
+    # Round to 3 decimals to avoid floating point issues; Counter tallies
+    # in C instead of a Python-level dict.get/set per note.
+    counts = Counter(map(round, durations, repeat(3)))
     
     total = len(durations)
     return {dur: count / total for dur, count in counts.items()}
+
+
+def format_duration_counts(counts: Dict[float, int]) -> Dict[str, int]:
+    """
+    Convert raw duration tallies into the debug_stats key format.
+    
+    Args:
+        counts: Number of uses per duration value (first-use order)
+    
+    Returns:
+        Counts keyed by the duration formatted as "0.250"
+    """
+    formatted = {}
+    for dur, count in counts.items():
+        key = f"{dur:.3f}"
+        formatted[key] = formatted.get(key, 0) + count
+    return formatted
@@ -1,17 +1,12 @@
 """
 バッチ生成の基本動作テスト。
 """
-import json
-import os
-import sys
 import tempfile
 from argparse import Namespace
 from pathlib import Path
 
-# インポート用に親ディレクトリを追加
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from songmaking import cli
+from songmaking._test_utils import read_json
 
 
 def test_resolve_batch_id_collision():
@@ -67,19 +62,9 @@ def test_generate_and_save_batch_metadata():
         assert midi_path.exists()
         assert json_path.exists()
 
-        with open(json_path, "r") as f:
-            metadata = json.load(f)
+        metadata = read_json(json_path)
 
         assert metadata["batch_id"] == "2026-02-16-A"
         assert metadata["seed"] == 123
 
     print("✓ test_generate_and_save_batch_metadata passed")
-
-
-if __name__ == "__main__":
-    print("Running batch generation tests...\n")
-    test_resolve_batch_id_collision()
-    test_generate_and_save_batch_metadata()
-    print("\n============================================================")
-    print("All batch generation tests passed! ✓")
-    print("============================================================")
@@ -2,30 +2,34 @@
 Tests for concatenated fragment metadata.
 Ensures note_count is included in JSON output.
 """
-import json
-import os
-import sys
+import io
 import tempfile
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from functools import lru_cache
+from pathlib import Path
+from unittest.mock import patch
 
 import pretty_midi
 
+from songmaking._test_utils import read_json
 from songmaking.export import concat_fragments
 
 
-def _stub_generate_melody_midi(harmony_spec, method, seed, generation_config):
-    pm = pretty_midi.PrettyMIDI(initial_tempo=harmony_spec.beats_per_minute)
+@lru_cache(maxsize=16)
+def _stub_midi_bytes(bpm):
+    """Two-note MIDI (C4, D4) at the given tempo, built once per bpm."""
+    pm = pretty_midi.PrettyMIDI(initial_tempo=bpm)
     instrument = pretty_midi.Instrument(program=0)
     instrument.notes.append(pretty_midi.Note(velocity=100, pitch=60, start=0.0, end=0.5))
     instrument.notes.append(pretty_midi.Note(velocity=100, pitch=62, start=0.5, end=1.0))
     pm.instruments.append(instrument)
 
-    with tempfile.NamedTemporaryFile(suffix=".mid") as tmp_midi:
-        pm.write(tmp_midi.name)
-        tmp_midi.seek(0)
-        midi_bytes = tmp_midi.read()
+    buffer = io.BytesIO()
+    pm.write(buffer)
+    return buffer.getvalue()
+
+
+def _stub_generate_melody_midi(harmony_spec, method, seed, generation_config):
+    midi_bytes = _stub_midi_bytes(harmony_spec.beats_per_minute)
 
     pitches = [60, 62]
     durations = [0.5, 0.5]
@@ -46,14 +50,11 @@ def _stub_generate_melody_midi(harmony_spec, method, seed, generation_config):
 
 def test_fragment_metadata_includes_note_count():
     """Test that fragment metadata includes note_count."""
-    original_generate = concat_fragments.generate_melody_midi
-    concat_fragments.generate_melody_midi = _stub_generate_melody_midi
-
-    try:
+    with patch.object(concat_fragments, "generate_melody_midi", _stub_generate_melody_midi):
         with tempfile.TemporaryDirectory() as tmpdir:
-            out_path = os.path.join(tmpdir, "concat_test")
+            out_path = Path(tmpdir) / "concat_test"
             concat_fragments.export_concatenated_fragments(
-                out_path=out_path,
+                out_path=str(out_path),
                 harmony="auto",
                 method="random",
                 seed=42,
@@ -63,8 +64,7 @@ def test_fragment_metadata_includes_note_count():
                 gap_beats=0.0
             )
 
-            with open(f"{out_path}.json", "r") as f:
-                metadata = json.load(f)
+            metadata = read_json(out_path.with_suffix(".json"))
 
             fragment = metadata["fragments"][0]
             assert fragment["note_count"] == 2, f"Expected note_count 2, got {fragment['note_count']}"
@@ -72,13 +72,3 @@ def test_fragment_metadata_includes_note_count():
                 f"Expected mean_interval 2.0, got {fragment['mean_interval']}"
 
         print("✓ test_fragment_metadata_includes_note_count passed")
-    finally:
-        concat_fragments.generate_melody_midi = original_generate
-
-
-if __name__ == "__main__":
-    print("Running concatenated fragment metadata tests...\n")
-    test_fragment_metadata_includes_note_count()
-    print("\n" + "=" * 60)
-    print("All concatenated fragment metadata tests passed! ✓")
-    print("=" * 60)
@@ -2,11 +2,8 @@
 Tests for melody fragment generation improvements.
 Tests discrete durations, grid snapping, scale constraints, and debug stats.
 """
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import math
+from functools import lru_cache
 
 from songmaking.harmony import choose_harmony
 from songmaking.generators.random import generate_random_melody
@@ -20,57 +17,65 @@ from songmaking.note_utils import (
     is_pitch_in_scale
 )
 
+_VALID_DURATIONS = tuple(DURATION_VALUES)
+_REQUIRED_DEBUG_KEYS = frozenset({
+    "duration_distribution",
+    "scale_out_rejections",
+    "octave_up_events",
+    "total_beats",
+})
 
-def test_discrete_durations_random():
-    """Test that random generator only uses discrete note durations."""
-    spec = choose_harmony(42, {'bars': 2, 'min_bpm': 120, 'max_bpm': 120})
-    pitches, durations, debug_stats = generate_random_melody(spec, 42, {'rest_probability': 0.1})
-    
-    valid_durations = set(DURATION_VALUES)
-    
-    for dur in durations:
-        # Check if duration matches one of the discrete values (with small tolerance)
-        assert any(abs(dur - vd) < 0.001 for vd in valid_durations), \
-            f"Duration {dur} is not a valid discrete value"
-    
-    print(f"✓ test_discrete_durations_random passed ({len(durations)} durations checked)")
 
+@lru_cache(maxsize=None)
+def _spec(seed, bars, bpm=120):
+    """Shared HarmonySpec per (seed, bars, bpm); tests must not mutate it."""
+    return choose_harmony(seed, {'bars': bars, 'min_bpm': bpm, 'max_bpm': bpm})
 
-def test_discrete_durations_scored():
-    """Test that scored generator only uses discrete note durations."""
-    spec = choose_harmony(42, {'bars': 2, 'min_bpm': 120, 'max_bpm': 120})
-    pitches, durations, score, debug_stats = generate_scored_melody(
-        spec, 42, {'rest_probability': 0.1, 'candidate_count': 5}
+
+def _count_out_of_scale(spec, pitches):
+    """Count sounding pitches (rests skipped) outside the spec's scale."""
+    # build_scale_pitch_set is memoised; a frozenset keeps each check O(1)
+    scale_set = frozenset(build_scale_pitch_set(
+        spec.tonic_note,
+        spec.scale_pattern,
+        spec.lowest_midi,
+        spec.highest_midi
+    ))
+    return sum(
+        1 for pitch in pitches
+        if pitch > 0 and not is_pitch_in_scale(pitch, scale_set)
     )
-    
-    valid_durations = set(DURATION_VALUES)
-    
+
+
+def _assert_discrete(durations, source="durations"):
+    """Assert every duration matches a discrete value (0.001 tolerance)."""
     for dur in durations:
-        assert any(abs(dur - vd) < 0.001 for vd in valid_durations), \
-            f"Duration {dur} is not a valid discrete value"
-    
-    print(f"✓ test_discrete_durations_scored passed ({len(durations)} durations checked)")
+        assert any(abs(dur - vd) < 0.001 for vd in _VALID_DURATIONS), \
+            f"Duration {dur} from {source} is not a valid discrete value"
 
 
-def test_discrete_durations_markov():
-    """Test that markov generator only uses discrete note durations."""
-    spec = choose_harmony(42, {'bars': 2, 'min_bpm': 120, 'max_bpm': 120})
-    pitches, durations, debug_stats = generate_markov_melody(
-        spec, 42, {'rest_probability': 0.1, 'ngram_order': 2}
-    )
+def test_discrete_durations_all():
+    """Test that every generator only uses discrete note durations."""
+    spec = _spec(42, 2)
+    cases = [
+        (generate_random_melody, {'rest_probability': 0.1}),
+        (generate_scored_melody, {'rest_probability': 0.1, 'candidate_count': 5}),
+        (generate_markov_melody, {'rest_probability': 0.1, 'ngram_order': 2}),
+    ]
     
-    valid_durations = set(DURATION_VALUES)
+    checked = 0
+    for method_fn, config in cases:
+        # durations is the second element of both the 3- and 4-tuple returns
+        durations = method_fn(spec, 42, config)[1]
+        _assert_discrete(durations, method_fn.__name__)
+        checked += len(durations)
     
-    for dur in durations:
-        assert any(abs(dur - vd) < 0.001 for vd in valid_durations), \
-            f"Duration {dur} is not a valid discrete value"
-    
-    print(f"✓ test_discrete_durations_markov passed ({len(durations)} durations checked)")
+    print(f"✓ test_discrete_durations_all passed ({checked} durations checked)")
 
 
 def test_total_duration_constraint():
     """Test that total duration does not exceed bars * beats_per_bar."""
-    spec = choose_harmony(100, {'bars': 4, 'min_bpm': 120, 'max_bpm': 120})
+    spec = _spec(100, 4)
     
     for method_fn in [generate_random_melody, generate_markov_melody]:
         if method_fn == generate_markov_melody:
@@ -78,10 +83,11 @@ def test_total_duration_constraint():
         else:
             pitches, durations, debug_stats = method_fn(spec, 100, {'rest_probability': 0.1})
         
-        total_beats = sum(durations)
+        # Durations are dyadic and fsum rounds once, so no tolerance is needed
+        total_beats = math.fsum(durations)
         max_beats = spec.total_measures * 4  # 4/4 time
         
-        assert total_beats <= max_beats + 0.01, \
+        assert total_beats <= max_beats, \
             f"Total duration {total_beats} exceeds max {max_beats}"
     
     print("✓ test_total_duration_constraint passed")
@@ -89,20 +95,10 @@ def test_total_duration_constraint():
 
 def test_scale_constraint_random():
     """Test that random generator only uses pitches from scale."""
-    spec = choose_harmony(123, {'bars': 2, 'min_bpm': 120, 'max_bpm': 120})
+    spec = _spec(123, 2)
     pitches, durations, debug_stats = generate_random_melody(spec, 123, {'rest_probability': 0.1})
     
-    scale_pitches = build_scale_pitch_set(
-        spec.tonic_note,
-        spec.scale_pattern,
-        spec.lowest_midi,
-        spec.highest_midi
-    )
-    
-    violations = 0
-    for pitch in pitches:
-        if pitch > 0 and not is_pitch_in_scale(pitch, scale_pitches):
-            violations += 1
+    violations = _count_out_of_scale(spec, pitches)
     
     assert violations == 0, f"Found {violations} out-of-scale pitches"
     
@@ -111,20 +107,10 @@ def test_scale_constraint_random():
 
 def test_scale_constraint_markov():
     """Test that markov generator quantizes to scale pitches."""
-    spec = choose_harmony(456, {'bars': 2, 'min_bpm': 120, 'max_bpm': 120})
+    spec = _spec(456, 2)
     pitches, durations, debug_stats = generate_markov_melody(spec, 456, {'ngram_order': 2})
     
-    scale_pitches = build_scale_pitch_set(
-        spec.tonic_note,
-        spec.scale_pattern,
-        spec.lowest_midi,
-        spec.highest_midi
-    )
-    
-    violations = 0
-    for pitch in pitches:
-        if pitch > 0 and not is_pitch_in_scale(pitch, scale_pitches):
-            violations += 1
+    violations = _count_out_of_scale(spec, pitches)
     
     assert violations == 0, f"Found {violations} out-of-scale pitches"
     
@@ -133,26 +119,27 @@ def test_scale_constraint_markov():
 
 def test_pitch_range_constraint():
     """Test that all pitches respect min/max MIDI range."""
-    spec = choose_harmony(789, {'bars': 2, 'min_bpm': 120, 'max_bpm': 120})
+    spec = _spec(789, 2)
     pitches, durations, debug_stats = generate_random_melody(spec, 789, {'rest_probability': 0.1})
     
-    for pitch in pitches:
-        if pitch > 0:  # Skip rests
-            assert spec.lowest_midi <= pitch <= spec.highest_midi, \
-                f"Pitch {pitch} outside range [{spec.lowest_midi}, {spec.highest_midi}]"
+    # Collect every offender (rests skipped) so a failure reports them all
+    out_of_range = [
+        pitch for pitch in pitches
+        if pitch > 0 and not spec.lowest_midi <= pitch <= spec.highest_midi
+    ]
+    assert not out_of_range, \
+        f"Pitches {out_of_range[:5]} outside range [{spec.lowest_midi}, {spec.highest_midi}]"
     
     print("✓ test_pitch_range_constraint passed")
 
 
 def test_debug_stats_random():
     """Test that random generator returns debug stats."""
-    spec = choose_harmony(42, {'bars': 2, 'min_bpm': 120, 'max_bpm': 120})
+    spec = _spec(42, 2)
     pitches, durations, debug_stats = generate_random_melody(spec, 42, {'rest_probability': 0.1})
     
-    assert "duration_distribution" in debug_stats
-    assert "scale_out_rejections" in debug_stats
-    assert "octave_up_events" in debug_stats
-    assert "total_beats" in debug_stats
+    missing = _REQUIRED_DEBUG_KEYS - debug_stats.keys()
+    assert not missing, f"debug_stats is missing {sorted(missing)}"
     
     # Check that duration distribution sums to number of notes
     total_in_dist = sum(debug_stats["duration_distribution"].values())
@@ -168,35 +155,31 @@ def test_debug_stats_random():
 
 def test_debug_stats_scored():
     """Test that scored generator returns debug stats."""
-    spec = choose_harmony(42, {'bars': 2, 'min_bpm': 120, 'max_bpm': 120})
+    spec = _spec(42, 2)
     pitches, durations, score, debug_stats = generate_scored_melody(
         spec, 42, {'rest_probability': 0.1, 'candidate_count': 5}
     )
     
-    assert "duration_distribution" in debug_stats
-    assert "scale_out_rejections" in debug_stats
-    assert "octave_up_events" in debug_stats
-    assert "total_beats" in debug_stats
+    missing = _REQUIRED_DEBUG_KEYS - debug_stats.keys()
+    assert not missing, f"debug_stats is missing {sorted(missing)}"
     
     print("✓ test_debug_stats_scored passed")
 
 
 def test_debug_stats_markov():
     """Test that markov generator returns debug stats."""
-    spec = choose_harmony(42, {'bars': 2, 'min_bpm': 120, 'max_bpm': 120})
+    spec = _spec(42, 2)
     pitches, durations, debug_stats = generate_markov_melody(spec, 42, {'ngram_order': 2})
     
-    assert "duration_distribution" in debug_stats
-    assert "scale_out_rejections" in debug_stats
-    assert "octave_up_events" in debug_stats
-    assert "total_beats" in debug_stats
+    missing = _REQUIRED_DEBUG_KEYS - debug_stats.keys()
+    assert not missing, f"debug_stats is missing {sorted(missing)}"
     
     print("✓ test_debug_stats_markov passed")
 
 
 def test_octave_up_events_tracked():
     """Test that octave-up events are tracked in debug stats."""
-    spec = choose_harmony(999, {'bars': 4, 'min_bpm': 120, 'max_bpm': 120})
+    spec = _spec(999, 4)
     
     # Set high octave-up chance to ensure some events
     config = {'rest_probability': 0.05, 'octave_up_chance': 0.1}
@@ -218,39 +201,15 @@ def test_octave_up_events_tracked():
 
 def test_duration_distribution_validity():
     """Test that duration distribution in debug stats is valid."""
-    spec = choose_harmony(42, {'bars': 2, 'min_bpm': 120, 'max_bpm': 120})
+    spec = _spec(42, 2)
     pitches, durations, debug_stats = generate_random_melody(spec, 42, {'rest_probability': 0.1})
     
     dist = debug_stats["duration_distribution"]
     
     # All keys should be valid duration values
-    valid_durations = set(DURATION_VALUES)
+    _assert_discrete(map(float, dist), "duration_distribution")
     
     for key_str, count in dist.items():
-        dur_value = float(key_str)
-        assert any(abs(dur_value - vd) < 0.001 for vd in valid_durations), \
-            f"Invalid duration {dur_value} in distribution"
         assert count > 0, f"Duration {key_str} has non-positive count {count}"
     
     print("✓ test_duration_distribution_validity passed")
-
-
-if __name__ == "__main__":
-    print("Running melody improvement tests...\n")
-    
-    test_discrete_durations_random()
-    test_discrete_durations_scored()
-    test_discrete_durations_markov()
-    test_total_duration_constraint()
-    test_scale_constraint_random()
-    test_scale_constraint_markov()
-    test_pitch_range_constraint()
-    test_debug_stats_random()
-    test_debug_stats_scored()
-    test_debug_stats_markov()
-    test_octave_up_events_tracked()
-    test_duration_distribution_validity()
-    
-    print("\n" + "=" * 60)
-    print("All melody improvement tests passed! ✓")
-    print("=" * 60)
@@ -2,16 +2,13 @@
 Tests for mean pitch target/tolerance constraint feature.
 Verifies pitch statistics calculation and constraint enforcement.
 """
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from songmaking.pitch_stats import (
     calculate_mean_pitch,
     calculate_mean_interval,
     check_pitch_constraint,
+    evaluate_melody,
+    make_mean_pitch_checker,
+    make_pitch_checker,
     get_pitch_stats,
     compute_pitch_stats,
     extract_melody_pitches_from_midi
@@ -109,6 +106,44 @@ def test_check_pitch_constraint_boundary():
     print("✓ test_check_pitch_constraint_boundary passed")
 
 
+def test_make_pitch_checker_matches_check_pitch_constraint():
+    """Test that the prebuilt checker agrees with check_pitch_constraint."""
+    cases = [
+        ([60, 61, 62], 61.0, 2.0),
+        ([60, 61, 62], 70.0, 2.0),
+        ([60, 61, 62], 61.5, 0.1),
+        ([60], 62.0, 2.0),  # exactly at lower boundary
+        ([60], 58.0, 2.0),  # exactly at upper boundary
+        ([0, 0, 0], 60.0, 2.0),  # all rests
+    ]
+    
+    for notes, target, tolerance in cases:
+        checker = make_pitch_checker(target, tolerance)
+        assert checker(notes) is check_pitch_constraint(notes, target, tolerance), \
+            f"Mismatch for {notes} with target {target}±{tolerance}"
+    
+    print("✓ test_make_pitch_checker_matches_check_pitch_constraint passed")
+
+
+def test_make_mean_pitch_checker_matches_get_pitch_stats_mean():
+    """Test that checking get_pitch_stats' mean agrees with check_pitch_constraint."""
+    cases = [
+        ([60, 61, 62], 61.0, 2.0),
+        ([60, 61, 62], 70.0, 2.0),
+        ([60], 62.0, 2.0),  # exactly at lower boundary
+        ([60], 58.0, 2.0),  # exactly at upper boundary
+        ([0, 0, 0], 60.0, 2.0),  # all rests: mean is None
+    ]
+    
+    for notes, target, tolerance in cases:
+        mean_in_range = make_mean_pitch_checker(target, tolerance)
+        mean = get_pitch_stats(notes)["mean"]
+        assert mean_in_range(mean) is check_pitch_constraint(notes, target, tolerance), \
+            f"Mismatch for {notes} with target {target}±{tolerance}"
+    
+    print("✓ test_make_mean_pitch_checker_matches_get_pitch_stats_mean passed")
+
+
 def test_get_pitch_stats_comprehensive():
     """Test comprehensive pitch statistics."""
     notes = [60, 0, 64, 67, 0, 72]  # C4, rest, E4, G4, rest, C5
@@ -159,9 +194,9 @@ def test_generation_with_pitch_constraint():
         seed = 42 + attempt
         pitches, durations, debug_stats = generate_random_melody(spec, seed, {'rest_probability': 0.1})
         
-        if check_pitch_constraint(pitches, target_pitch, tolerance):
+        mean, meets_constraint = evaluate_melody(pitches, target_pitch, tolerance)
+        if meets_constraint:
             success = True
-            mean = calculate_mean_pitch(pitches)
             print(f"  Found melody with mean pitch {mean:.2f} (target {target_pitch:.1f}±{tolerance}) on attempt {attempt + 1}")
             break
     
@@ -214,13 +249,14 @@ def test_tight_constraint_requires_multiple_attempts():
     
     attempts_needed = 0
     max_attempts = 200
+    meets_constraint = make_pitch_checker(target_pitch, tolerance)
     
     for attempt in range(max_attempts):
         seed = 123 + attempt
         pitches, durations, debug_stats = generate_random_melody(spec, seed, {'rest_probability': 0.1})
         attempts_needed += 1
         
-        if check_pitch_constraint(pitches, target_pitch, tolerance):
+        if meets_constraint(pitches):
             break
     
     # With tight constraint, should need more than 1 attempt (statistically likely)
@@ -374,33 +410,3 @@ def test_generate_melody_midi_returns_enhanced_pitch_stats():
             "pitch_range should equal pitch_max - pitch_min"
     
     print("✓ test_generate_melody_midi_returns_enhanced_pitch_stats passed")
-
-
-if __name__ == "__main__":
-    print("Running pitch constraint tests...\n")
-    
-    test_calculate_mean_pitch_basic()
-    test_calculate_mean_pitch_with_rests()
-    test_calculate_mean_pitch_all_rests()
-    test_check_pitch_constraint_within_tolerance()
-    test_check_pitch_constraint_outside_tolerance()
-    test_check_pitch_constraint_boundary()
-    test_get_pitch_stats_comprehensive()
-    test_get_pitch_stats_all_rests()
-    test_generation_with_pitch_constraint()
-    test_generate_melody_midi_returns_pitch_stats()
-    test_tight_constraint_requires_multiple_attempts()
-    
-    # New tests for compute_pitch_stats
-    test_compute_pitch_stats_basic()
-    test_compute_pitch_stats_with_rests()
-    test_compute_pitch_stats_empty_notes()
-    test_compute_pitch_stats_all_rests()
-    test_compute_pitch_stats_single_note()
-    test_calculate_mean_interval_basic()
-    test_extract_melody_pitches_from_midi()
-    test_generate_melody_midi_returns_enhanced_pitch_stats()
-    
-    print("\n" + "=" * 60)
-    print("All pitch constraint tests passed! ✓")
-    print("=" * 60)
@@ -2,12 +2,6 @@
 Tests for melody structure specification and structural constraints.
 Tests repeat unit, rhythm profile, motif variation, and structural scoring.
 """
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from songmaking.harmony import choose_harmony
 from songmaking.structure import MelodyStructureSpec, create_structured_spec
 from songmaking.generators.random import generate_random_melody
@@ -221,21 +215,3 @@ def test_repeat_count_calculation():
     assert count2 == 6, f"Expected 6 two-beat units, got {count2}"
     
     print("✓ test_repeat_count_calculation passed")
-
-
-if __name__ == "__main__":
-    print("Running structure specification tests...\n")
-    
-    test_structure_spec_creation()
-    test_self_similarity_metric()
-    test_rhythm_profile_alignment()
-    test_motif_repetition_application()
-    test_random_generator_with_structure()
-    test_scored_generator_with_structure()
-    test_markov_generator_with_structure()
-    test_duration_distribution_calculation()
-    test_repeat_count_calculation()
-    
-    print("\n" + "=" * 60)
-    print("All structure specification tests passed!")
-    print("=" * 60)
@@ -2,12 +2,6 @@
 Minimal targeted tests for MIDI timing and --bars option.
 Tests that beats/tempo align correctly and bars parameter works.
 """
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from songmaking.harmony import choose_harmony, HarmonySpec
 from songmaking.generators.random import generate_random_melody
 from songmaking.export_midi import create_melody_midi
@@ -104,18 +98,3 @@ def test_tempo_set_in_midi():
     # This is a basic check - proper MIDI parsing would be more thorough
     assert len(midi_bytes) > 20, "MIDI file should have reasonable size"
     print(f"✓ test_tempo_set_in_midi passed")
-
-
-if __name__ == "__main__":
-    print("Running MIDI timing tests...\n")
-    
-    test_bars_option_4_4_time()
-    test_bars_default_behavior()
-    test_total_beats_calculation()
-    test_rhythm_doesnt_exceed_total()
-    test_midi_export_uses_beats()
-    test_tempo_set_in_midi()
-    
-    print("\n" + "=" * 60)
-    print("All tests passed! ✓")
-    print("=" * 60)